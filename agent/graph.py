@@ -1,20 +1,66 @@
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
 import logging
+import threading
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.cache.memory import InMemoryCache
+from langgraph.types import CachePolicy, RetryPolicy
 
-from .state import ResearchWorkflowState, is_workflow_complete
+from .state import (
+    ResearchWorkflowState,
+    ResearchWorkflowConfig,
+    initialize_workflow_state,
+    update_state_progress,
+    update_state_error,
+    get_workflow_summary,
+    is_workflow_complete
+)
 from .nodes import (
     generate_keywords_node,
     crawl_papers_node,
     filter_papers_node,
+    summarize_batch_node,
     summarize_papers_node,
+    aggregate_lang_node,
     aggregate_summary_node,
     finalize_workflow_node,
-    error_handler_node
+    error_handler_node,
+    NodeFailedError,
+    TransientToolError
+)
+
+# Upper bound on parallel branches (per-paper summaries, per-language aggregation) in one run
+MAX_CONCURRENCY = 16
+
+# How long cached keyword/crawl node results are reused before the node runs again
+NODE_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Retry nodes whose LLM/HTTP calls hit rate limits, timeouts or unavailable services
+TOOL_RETRY_POLICY = RetryPolicy(
+    max_attempts=4,
+    initial_interval=1.0,
+    backoff_factor=2.0,
+    retry_on=TransientToolError
 )
 
 
+def _keywords_cache_key(state: ResearchWorkflowState) -> str:
+    """
+    Cache key for generate_keywords: the topic, the LLM that generates its keywords and
+    skip_crawling, which picks the node the cached Command routes to.
+    """
+    key = f"{state['topic']}|{state['api']}|{state['model_name']}|{bool(state.get('skip_crawling', False))}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _crawl_cache_key(state: ResearchWorkflowState) -> str:
+    """Cache key for crawl_papers: the conference and year being crawled."""
+    return hashlib.sha1(f"{state['conference']}|{state['year']}".encode()).hexdigest()
+
+
 def create_research_workflow_graph() -> CompiledStateGraph:
     """
     Create and compile the research trend analysis workflow graph.
@@ -28,98 +74,57 @@ def create_research_workflow_graph() -> CompiledStateGraph:
     workflow = StateGraph(ResearchWorkflowState)
     
     # Add all nodes to the graph
-    workflow.add_node("generate_keywords", generate_keywords_node)
-    workflow.add_node("crawl_papers", crawl_papers_node)
-    workflow.add_node("filter_papers", filter_papers_node)
+    workflow.add_node(
+        "generate_keywords",
+        generate_keywords_node,
+        cache_policy=CachePolicy(key_func=_keywords_cache_key, ttl=NODE_CACHE_TTL_SECONDS),
+        retry_policy=TOOL_RETRY_POLICY
+    )
+    workflow.add_node(
+        "crawl_papers",
+        crawl_papers_node,
+        cache_policy=CachePolicy(key_func=_crawl_cache_key, ttl=NODE_CACHE_TTL_SECONDS),
+        retry_policy=TOOL_RETRY_POLICY
+    )
+    workflow.add_node("filter_papers", filter_papers_node, retry_policy=TOOL_RETRY_POLICY)
+    workflow.add_node("summarize_batch", summarize_batch_node)
     workflow.add_node("summarize_papers", summarize_papers_node)
+    workflow.add_node("aggregate_lang", aggregate_lang_node)
     workflow.add_node("aggregate_summary", aggregate_summary_node)
     workflow.add_node("finalize_workflow", finalize_workflow_node)
     workflow.add_node("handle_error", error_handler_node)
     
-    # Define the main workflow sequence with conditional entry points
-    workflow.set_entry_point("check_keyword_generation")
-
-    # Add conditional check nodes
-    workflow.add_node("check_keyword_generation", lambda state: state)
-    workflow.add_node("check_crawling", lambda state: state)
-
-    # Conditional edges for keyword generation
-    workflow.add_conditional_edges(
-        "check_keyword_generation",
-        check_skip_keyword_generation,
-        {"skip": "check_crawling", "generate": "generate_keywords"}
+    # Conditional entry point: skip keyword generation and/or crawling as configured
+    workflow.set_conditional_entry_point(
+        route_entry,
+        {"generate": "generate_keywords", "crawl": "crawl_papers", "skip": "filter_papers"}
     )
 
-    # Conditional edges for paper crawling
-    workflow.add_conditional_edges(
-        "check_crawling",
-        check_skip_crawling,
-        {"skip": "filter_papers", "crawl": "crawl_papers"}
-    )
-
-    # Main success path
-    workflow.add_edge("generate_keywords", "check_crawling")
-    workflow.add_edge("crawl_papers", "filter_papers")
-    workflow.add_edge("filter_papers", "summarize_papers")
-    workflow.add_edge("summarize_papers", "aggregate_summary")
-    workflow.add_edge("aggregate_summary", "finalize_workflow")
-    workflow.add_edge("finalize_workflow", END)
+    # The main nodes return a Command that routes to the next node on success and
+    # to the error handler on failure; the fan-out workers flow into their fan-in node
+    workflow.add_edge("summarize_batch", "summarize_papers")
+    workflow.add_edge("aggregate_lang", "aggregate_summary")
     
-    # Error handling - any node can transition to error handler
-    workflow.add_conditional_edges(
-        "generate_keywords",
-        check_for_errors,
-        {"continue": "crawl_papers", "error": "handle_error"}
-    )
-    
-    workflow.add_conditional_edges(
-        "crawl_papers",
-        check_for_errors,
-        {"continue": "filter_papers", "error": "handle_error"}
-    )
-    
-    workflow.add_conditional_edges(
-        "filter_papers",
-        check_for_errors,
-        {"continue": "summarize_papers", "error": "handle_error"}
-    )
-    
-    workflow.add_conditional_edges(
-        "summarize_papers",
-        check_for_errors,
-        {"continue": "aggregate_summary", "error": "handle_error"}
-    )
-    
-    workflow.add_conditional_edges(
-        "aggregate_summary",
-        check_for_errors,
-        {"continue": "finalize_workflow", "error": "handle_error"}
-    )
-    
-    # Error handler always goes to end
+    # Finalization and the error handler always go to end
+    workflow.add_edge("finalize_workflow", END)
     workflow.add_edge("handle_error", END)
     
-    # Compile the graph
-    compiled_graph = workflow.compile()
+    # Compile the graph; the in-memory cache lets repeat runs skip cached nodes
+    compiled_graph = workflow.compile(cache=InMemoryCache())
     
     logging.info("[GRAPH] Research workflow graph compiled successfully")
     return compiled_graph
 
 
-def check_for_errors(state: ResearchWorkflowState) -> str:
+@lru_cache(maxsize=None)
+def get_compiled_graph() -> CompiledStateGraph:
     """
-    Check if the current state contains any errors.
+    Get the compiled workflow graph, compiling it only once per process.
     
-    Args:
-        state: Current workflow state
-        
     Returns:
-        "continue" if no errors, "error" if errors found
+        Shared compiled state graph for the research workflow
     """
-    if state.get("status") == "error":
-        logging.warning(f"[GRAPH] Error detected in state: {state.get('error_message', 'Unknown error')}")
-        return "error"
-    return "continue"
+    return create_research_workflow_graph()
 
 
 def check_skip_keyword_generation(state: ResearchWorkflowState) -> str:
@@ -154,6 +159,22 @@ def check_skip_crawling(state: ResearchWorkflowState) -> str:
     return "crawl"
 
 
+def route_entry(state: ResearchWorkflowState) -> str:
+    """
+    Pick the first node to run based on the skip flags.
+    
+    Args:
+        state: Current workflow state
+        
+    Returns:
+        "generate" to generate keywords, "crawl" to start with crawling,
+        "skip" to go straight to filtering
+    """
+    if check_skip_keyword_generation(state) == "generate":
+        return "generate"
+    return check_skip_crawling(state)
+
+
 def check_workflow_completion(state: ResearchWorkflowState) -> str:
     """
     Check if the workflow has completed successfully.
@@ -178,15 +199,74 @@ class ResearchWorkflowAgent:
     
     def __init__(self):
         """Initialize the research workflow agent."""
-        self.graph = create_research_workflow_graph()
+        self.graph = get_compiled_graph()
+        self._mermaid: Optional[str] = None
+        self._structure: Optional[Dict[str, Any]] = None
         logging.info("[AGENT] Research workflow agent initialized")
     
-    def run_workflow(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    async def _astream(self, config: Dict[str, Any], stream_modes: Tuple[str, ...]) -> AsyncIterator[Tuple[str, Any]]:
         """
-        Run the complete research trend analysis workflow.
+        Stream a workflow run for the given configuration.
+        A node that raises NodeFailedError (a cached node's failure, or a TransientToolError whose
+        retries ran out) ends the graph run; the run is then finished here through the error
+        handler, so the failure is recorded like any other.
         
         Args:
             config: Configuration dictionary for the workflow
+            stream_modes: Langgraph stream modes to emit ("updates" and/or "values")
+            
+        Yields:
+            (stream mode, chunk) pairs
+        """
+        # Initialize state from config
+        workflow_config = ResearchWorkflowConfig(**config)
+        state = initialize_workflow_state(workflow_config)
+        
+        try:
+            async for mode, chunk in self.graph.astream(
+                state,
+                config={"max_concurrency": MAX_CONCURRENCY},
+                stream_mode=["updates", "values"]
+            ):
+                if mode == "values":
+                    state = chunk
+                if mode in stream_modes:
+                    yield mode, chunk
+        except NodeFailedError as e:
+            logging.error(f"[AGENT] Node {e.step} failed: {e}")
+            failed_update = {**update_state_progress(state, e.step, "error"), **update_state_error(state, str(e))}
+            state = {**state, **failed_update}
+            handler_update = await error_handler_node(state)
+            state = {**state, **handler_update}
+            if "updates" in stream_modes:
+                yield "updates", {e.step: failed_update}
+                yield "updates", {"handle_error": handler_update}
+            if "values" in stream_modes:
+                yield "values", state
+    
+    async def astream_workflow(self, config: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the workflow, yielding each node's state update as soon as it finishes.
+        
+        Args:
+            config: Configuration dictionary for the workflow
+            
+        Yields:
+            Dictionaries mapping the node that just ran to its state update
+        """
+        logging.info(f"[AGENT] Streaming research workflow with config: {config}")
+        async for _, event in self._astream(config, ("updates",)):
+            yield event
+    
+    async def arun_workflow(self, config: Dict[str, Any],
+                            progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run the complete research trend analysis workflow asynchronously.
+        
+        Args:
+            config: Configuration dictionary for the workflow
+            progress_callback: Optional function called with each node's state update
+                (a dict mapping the node name to its update) as the workflow progresses
             
         Returns:
             Final workflow state with results
@@ -194,19 +274,20 @@ class ResearchWorkflowAgent:
         logging.info(f"[AGENT] Starting research workflow with config: {config}")
         
         try:
-            # Initialize state from config
-            from .state import ResearchWorkflowConfig, initialize_workflow_state
-            workflow_config = ResearchWorkflowConfig(**config)
-            initial_state = initialize_workflow_state(workflow_config)
-            
-            # Execute the workflow graph
-            final_state = self.graph.invoke(initial_state)
+            # Execute the workflow graph, reporting node updates as they arrive
+            final_state = None
+            async for mode, chunk in self._astream(config, ("updates", "values")):
+                if mode == "values":
+                    final_state = chunk
+                elif progress_callback is not None:
+                    progress_callback(chunk)
             
             # Get workflow summary
-            from .state import get_workflow_summary
             summary = get_workflow_summary(final_state)
             
             logging.info(f"[AGENT] Workflow completed with status: {summary['status']}")
+            if summary["processing_time"] is not None:
+                logging.info(f"[AGENT] Workflow completed in {summary['processing_time']:.2f}s")
             return summary
             
         except Exception as e:
@@ -220,6 +301,21 @@ class ResearchWorkflowAgent:
                 "topic": config.get("topic", "unknown")
             }
     
+    def run_workflow(self, config: Dict[str, Any],
+                     progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run the complete research trend analysis workflow.
+        Blocking wrapper around arun_workflow; must not be called from a running event loop.
+        
+        Args:
+            config: Configuration dictionary for the workflow
+            progress_callback: Optional function called with each node's state update
+            
+        Returns:
+            Final workflow state with results
+        """
+        return asyncio.run(self.arun_workflow(config, progress_callback))
+    
     def get_graph_visualization(self) -> Optional[str]:
         """
         Get a visualization of the workflow graph.
@@ -227,8 +323,11 @@ class ResearchWorkflowAgent:
         Returns:
             Graph visualization in DOT format, or None if not available
         """
+        if self._mermaid is not None:
+            return self._mermaid
         try:
-            return self.graph.get_graph().draw_mermaid()
+            self._mermaid = self.graph.get_graph().draw_mermaid()
+            return self._mermaid
         except Exception as e:
             logging.warning(f"[AGENT] Could not generate graph visualization: {e}")
             return None
@@ -240,34 +339,76 @@ class ResearchWorkflowAgent:
         Returns:
             Dictionary describing the graph structure
         """
+        if self._structure is not None:
+            return self._structure
         try:
             graph = self.graph.get_graph()
-            return {
+            self._structure = {
                 "nodes": list(graph.nodes),
                 "edges": list(graph.edges),
                 "entry_point": graph.entry_point,
                 "conditional_edges": getattr(graph, "conditional_edges", {})
             }
+            return self._structure
         except Exception as e:
             logging.warning(f"[AGENT] Could not get graph structure: {e}")
             return {"error": str(e)}
 
 
-# Create a singleton instance of the agent
-research_agent = ResearchWorkflowAgent()
+# Singleton instance of the agent, created on first use so importing this module stays cheap
+_agent: Optional[ResearchWorkflowAgent] = None
+_agent_lock = threading.Lock()
+
+
+def get_research_agent() -> ResearchWorkflowAgent:
+    """
+    Get the shared research workflow agent, creating it on first use.
+    
+    Returns:
+        The singleton ResearchWorkflowAgent
+    """
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                _agent = ResearchWorkflowAgent()
+    return _agent
 
 
-def run_research_workflow(config: Dict[str, Any]) -> Dict[str, Any]:
+def run_research_workflow(config: Dict[str, Any],
+                          progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
     """
     Convenience function to run the research workflow.
     
     Args:
         config: Configuration dictionary for the workflow
+        progress_callback: Optional function called with each node's state update
         
     Returns:
         Final workflow results
     """
-    return research_agent.run_workflow(config)
+    return get_research_agent().run_workflow(config, progress_callback)
+
+
+async def run_many(configs: List[Dict[str, Any]], max_concurrent: int = 4) -> List[Dict[str, Any]]:
+    """
+    Run several research workflows concurrently so their LLM/HTTP waits overlap.
+    
+    Args:
+        configs: List of configuration dictionaries, one per workflow
+        max_concurrent: Maximum number of workflows running at once, to stay under the LLM rate limit
+        
+    Returns:
+        Workflow results in the same order as configs
+    """
+    agent = get_research_agent()
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    
+    async def run_one(config: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await agent.arun_workflow(config)
+    
+    return await asyncio.gather(*[run_one(c) for c in configs])
 
 
 def get_workflow_visualization() -> Optional[str]:
@@ -277,4 +418,4 @@ def get_workflow_visualization() -> Optional[str]:
     Returns:
         Graph visualization in DOT format
     """
-    return research_agent.get_graph_visualization()
\ No newline at end of file
+    return get_research_agent().get_graph_visualization()
\ No newline at end of file
@@ -1,18 +1,155 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional, Union
 import logging
 import time
-from datetime import datetime
+from functools import lru_cache
+from datetime import datetime, timezone
 from pathlib import Path
+from langchain.tools import BaseTool
+from langgraph.types import Command, Send
 
 from .state import ResearchWorkflowState, update_state_progress, update_state_error
-from tools.keywords_generator import KeywordsGeneratorTool
+from tools.keywords_generator import KeywordsGeneratorTool, load_keywords
 from tools.paper_crawler import PaperCrawlerTool
 from tools.paper_filter import PaperFilterTool
-from tools.paper_summarizer import PaperSummarizerTool
-from tools.summary_aggregator import SummaryAggregatorTool
+from tools.paper_summarizer import PaperSummarizerTool, unique_papers
+from tools.summary_aggregator import SummaryAggregatorTool, SUMMARY_LANGUAGES
+from utils.helper_func import load_jsonl
 
 
-def generate_keywords_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+# Tool classes used by the nodes, by kind
+TOOL_CLASSES = {
+    "keywords": KeywordsGeneratorTool,
+    "crawler": PaperCrawlerTool,
+    "filter": PaperFilterTool,
+    "summarizer": PaperSummarizerTool,
+    "aggregator": SummaryAggregatorTool
+}
+
+
+@lru_cache(maxsize=None)
+def get_tool(kind: str, api: Optional[str] = None, model_name: Optional[str] = None) -> BaseTool:
+    """
+    Get a shared tool instance, building it on first use.
+    Tools only hold configuration, so one instance per LLM configuration is
+    reused across nodes and concurrent workflow runs.
+    
+    Args:
+        kind: Tool kind, a key of TOOL_CLASSES
+        api: API to use for LLM calls (LLM-backed tools only)
+        model_name: Model name for LLM calls (LLM-backed tools only)
+        
+    Returns:
+        Cached tool instance
+    """
+    llm_config = {"api": api, "model_name": model_name} if api and model_name else {}
+    return TOOL_CLASSES[kind](**llm_config)
+
+
+class NodeFailedError(RuntimeError):
+    """
+    Raised by a node that fails without routing to handle_error: by cached nodes, so the failure
+    is never written to the node cache, and (as TransientToolError) by nodes whose retries ran out.
+    The agent records it and runs the error handler.
+    """
+    
+    def __init__(self, step: str, message: str):
+        super().__init__(message)
+        self.step = step
+
+
+class TransientToolError(NodeFailedError):
+    """
+    Raised by a node when its tool failed transiently, so the node's retry policy runs it again.
+    Once the retries are exhausted it is handled like any other NodeFailedError.
+    """
+
+
+def raise_if_transient(step: str, result: Dict[str, Any]) -> None:
+    """
+    Raise TransientToolError if a tool result is flagged as a transient failure.
+    Tools set "transient" from the exception type or HTTP status of the failure
+    (see utils.helper_func.is_transient_error), never from the error text.
+    
+    Args:
+        step: Name of the node whose tool failed
+        result: Error result returned by the tool
+    """
+    if result.get("transient"):
+        raise TransientToolError(step, result.get("error", ""))
+
+
+def _error_command(state: ResearchWorkflowState, updates: Dict[str, Any], error_msg: str) -> Command:
+    """
+    Record an error and route straight to the error handler.
+    
+    Args:
+        state: Current workflow state
+        updates: Partial state update built so far by the node
+        error_msg: Error message to store
+        
+    Returns:
+        Command updating the state with the error and going to handle_error
+    """
+    return Command(update={**updates, **update_state_error(state, error_msg)}, goto="handle_error")
+
+
+def _summary_sends(state: ResearchWorkflowState) -> Union[str, List[Send]]:
+    """
+    Dispatch one summarize_batch branch per batch_size papers in the topic's paper list.
+    
+    Args:
+        state: Current workflow state
+        
+    Returns:
+        A Send per batch of papers, or "summarize_papers" when there is nothing to summarize
+    """
+    paper_list_path, _ = get_tool("summarizer")._resolve_paths(state["conference"], state["year"], state["topic"])
+    try:
+        papers = unique_papers(load_jsonl(paper_list_path))
+    except Exception as e:
+        logging.warning(f"[NODE] Could not load paper list {paper_list_path}: {e}")
+        papers = []
+    
+    if not papers:
+        return "summarize_papers"
+    
+    batch_size = max(1, state["batch_size"])
+    logging.info(f"[NODE] Dispatching {len(papers)} papers in batches of {batch_size} for parallel summarization")
+    return [
+        Send("summarize_batch", {
+            "papers": papers[start:start + batch_size],
+            "conference": state["conference"],
+            "year": state["year"],
+            "topic": state["topic"],
+            "api": state["api"],
+            "model_name": state["model_name"]
+        })
+        for start in range(0, len(papers), batch_size)
+    ]
+
+
+def _aggregation_sends(state: ResearchWorkflowState) -> List[Send]:
+    """
+    Dispatch one aggregate_lang branch per summary language.
+    
+    Args:
+        state: Current workflow state
+        
+    Returns:
+        A Send per language
+    """
+    return [
+        Send("aggregate_lang", {
+            "language": language,
+            "conference": state["conference"],
+            "year": state["year"],
+            "topic": state["topic"]
+        })
+        for language in SUMMARY_LANGUAGES
+    ]
+
+
+async def generate_keywords_node(state: ResearchWorkflowState) -> Command[Literal["crawl_papers", "filter_papers"]]:
     """
     Node for generating research keywords for the given topic.
     
@@ -20,48 +157,61 @@ def generate_keywords_node(state: ResearchWorkflowState) -> ResearchWorkflowStat
         state: Current workflow state
         
     Returns:
-        Updated workflow state with generated keywords
+        Command with the generated keywords, going to crawling (or filtering when crawling is skipped)
+        
+    Raises:
+        NodeFailedError: If keyword generation failed, so the failure is not cached
     """
     logging.info(f"[NODE] Generating keywords for topic: {state['topic']}")
     
+    # Update state to show we're working on keyword generation
+    updates = update_state_progress(state, "generate_keywords")
+    next_node = "filter_papers" if state.get("skip_crawling", False) else "crawl_papers"
+    
     try:
-        # Update state to show we're working on keyword generation
-        state = update_state_progress(state, "generate_keywords")
-        
         # Check if we should skip keyword generation
         if state.get("skip_keyword_generation", False):
             logging.info("[NODE] Skipping keyword generation as requested")
-            return state
+            return Command(update=updates, goto=next_node)
         
-        # Initialize keyword generator tool with LLM configuration
-        keyword_tool = KeywordsGeneratorTool(
-            api=state["api"],
-            model_name=state["model_name"]
-        )
+        # Get keyword generator tool with LLM configuration
+        keyword_tool = get_tool("keywords", state["api"], state["model_name"])
+        
+        # Reuse keywords already saved for this topic instead of calling the LLM again
+        saved_keywords = load_keywords(state["topic"], keyword_tool.scope_list_path)
+        if saved_keywords:
+            logging.info(f"[NODE] Reusing {len(saved_keywords)} saved keywords for topic: {state['topic']}")
+            updates["generated_keywords"] = saved_keywords
+            updates["keywords_save_path"] = keyword_tool.scope_list_path
+            updates["status"] = "completed"
+            return Command(update=updates, goto=next_node)
         
         # Generate keywords
-        result = keyword_tool._run(state["topic"])
+        result = await keyword_tool._arun(state["topic"])
         
         if result["status"] != "success":
+            raise_if_transient("generate_keywords", result)
             error_msg = f"Failed to generate keywords: {result.get('error', 'Unknown error')}"
             logging.error(f"[NODE] {error_msg}")
-            return update_state_error(state, error_msg)
+            raise NodeFailedError("generate_keywords", error_msg)
         
         # Update state with generated keywords
-        state["generated_keywords"] = result.get("keywords", [])
-        state["keywords_save_path"] = result.get("save_result", "")
-        state["status"] = "completed"
+        updates["generated_keywords"] = result.get("keywords", [])
+        updates["keywords_save_path"] = result.get("save_result", "")
+        updates["status"] = "completed"
         
-        logging.info(f"[NODE] Generated {len(state['generated_keywords'])} keywords for topic: {state['topic']}")
-        return state
+        logging.info(f"[NODE] Generated {len(updates['generated_keywords'])} keywords for topic: {state['topic']}")
+        return Command(update=updates, goto=next_node)
         
+    except NodeFailedError:
+        raise
     except Exception as e:
         error_msg = f"Error in generate_keywords_node: {str(e)}"
         logging.exception(f"[NODE] {error_msg}")
-        return update_state_error(state, error_msg)
+        raise NodeFailedError("generate_keywords", error_msg) from e
 
 
-def crawl_papers_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+async def crawl_papers_node(state: ResearchWorkflowState) -> Command[Literal["filter_papers"]]:
     """
     Node for crawling papers from the specified conference and year.
     
@@ -69,46 +219,51 @@ def crawl_papers_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
         state: Current workflow state
         
     Returns:
-        Updated workflow state with crawled papers
+        Command with the crawl results, going to filtering
+        
+    Raises:
+        NodeFailedError: If crawling failed, so the failure is not cached
     """
     logging.info(f"[NODE] Crawling papers for {state['conference']} {state['year']}")
     
+    # Update state to show we're working on paper crawling
+    updates = update_state_progress(state, "crawl_papers")
+    
     try:
-        # Update state to show we're working on paper crawling
-        state = update_state_progress(state, "crawl_papers")
-        
         # Check if we should skip crawling
         if state.get("skip_crawling", False):
             logging.info("[NODE] Skipping paper crawling as requested")
-            return state
+            return Command(update=updates, goto="filter_papers")
         
-        # Initialize paper crawler tool
-        crawler_tool = PaperCrawlerTool()
+        # Get paper crawler tool
+        crawler_tool = get_tool("crawler")
 
         # Crawl papers
-        result = crawler_tool._run(state["conference"], state["year"])
+        result = await crawler_tool._arun(state["conference"], state["year"])
         
         if result["status"] != "success":
+            raise_if_transient("crawl_papers", result)
             error_msg = f"Failed to crawl papers: {result.get('error', 'Unknown error')}"
             logging.error(f"[NODE] {error_msg}")
-            return update_state_error(state, error_msg)
+            raise NodeFailedError("crawl_papers", error_msg)
         
         # Update state with crawl results
-        state["crawled_papers"] = []  # Papers are saved to file, not stored in memory
-        state["paper_list_path"] = result.get("save_path", "")
-        state["papers_crawled_count"] = result.get("papers_count", 0)
-        state["status"] = "completed"
+        updates["paper_list_path"] = result.get("save_path", "")
+        updates["papers_crawled_count"] = result.get("papers_count", 0)
+        updates["status"] = "completed"
         
-        logging.info(f"[NODE] Crawled {state['papers_crawled_count']} papers from {state['conference']} {state['year']}")
-        return state
+        logging.info(f"[NODE] Crawled {updates['papers_crawled_count']} papers from {state['conference']} {state['year']}")
+        return Command(update=updates, goto="filter_papers")
         
+    except NodeFailedError:
+        raise
     except Exception as e:
         error_msg = f"Error in crawl_papers_node: {str(e)}"
         logging.exception(f"[NODE] {error_msg}")
-        return update_state_error(state, error_msg)
+        raise NodeFailedError("crawl_papers", error_msg) from e
 
 
-def filter_papers_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+async def filter_papers_node(state: ResearchWorkflowState) -> Command[Literal["summarize_batch", "summarize_papers", "handle_error"]]:
     """
     Node for filtering papers by topic relevance.
     
@@ -116,22 +271,19 @@ def filter_papers_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
         state: Current workflow state
         
     Returns:
-        Updated workflow state with filtered papers
+        Command with the filter results, fanning out to the paper summaries
     """
     logging.info(f"[NODE] Filtering papers for topic: {state['topic']}")
     
+    # Update state to show we're working on paper filtering
+    updates = update_state_progress(state, "filter_papers")
+    
     try:
-        # Update state to show we're working on paper filtering
-        state = update_state_progress(state, "filter_papers")
-        
-        # Initialize paper filter tool with LLM configuration
-        filter_tool = PaperFilterTool(
-            api=state["api"],
-            model_name=state["model_name"]
-        )
+        # Get paper filter tool with LLM configuration
+        filter_tool = get_tool("filter", state["api"], state["model_name"])
         
         # Filter papers
-        result = filter_tool._run(
+        result = await filter_tool._arun(
             state["conference"], 
             state["year"], 
             state["topic"], 
@@ -139,133 +291,166 @@ def filter_papers_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
         )
         
         if result["status"] != "success":
+            raise_if_transient("filter_papers", result)
             error_msg = f"Failed to filter papers: {result.get('error', 'Unknown error')}"
             logging.error(f"[NODE] {error_msg}")
-            return update_state_error(state, error_msg)
+            return _error_command(state, updates, error_msg)
         
         # Update state with filter results
-        state["filtered_papers"] = []  # Papers are saved to file, not stored in memory
-        state["filtered_papers_path"] = result.get("save_path", "")
-        state["papers_filtered_count"] = result.get("filtered_count", 0)
-        state["status"] = "completed"
+        updates["filtered_papers_path"] = result.get("save_path", "")
+        updates["papers_filtered_count"] = result.get("filtered_count", 0)
+        updates["status"] = "completed"
         
-        logging.info(f"[NODE] Filtered {state['papers_filtered_count']} papers for topic: {state['topic']}")
-        return state
+        logging.info(f"[NODE] Filtered {updates['papers_filtered_count']} papers for topic: {state['topic']}")
+        return Command(update=updates, goto=_summary_sends(state))
         
+    except NodeFailedError:
+        raise
     except Exception as e:
         error_msg = f"Error in filter_papers_node: {str(e)}"
         logging.exception(f"[NODE] {error_msg}")
-        return update_state_error(state, error_msg)
+        return _error_command(state, updates, error_msg)
 
 
-def summarize_papers_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+async def summarize_batch_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Node for summarizing filtered papers.
+    Worker node for summarizing a batch of papers, dispatched in parallel via Send.
+    The papers of a batch are summarized concurrently by the summarizer tool.
     
     Args:
-        state: Current workflow state
+        state: Send payload with the papers and the workflow inputs they need
         
     Returns:
-        Updated workflow state with paper summaries
+        Partial update adding the batch's successes and failures to the summary counters
     """
-    logging.info(f"[NODE] Summarizing papers for {state['conference']} {state['year']}")
+    papers = state["papers"]
     
     try:
-        # Update state to show we're working on paper summarization
-        state = update_state_progress(state, "summarize_papers")
-        
-        # Initialize paper summarizer tool with LLM configuration
-        summarizer_tool = PaperSummarizerTool(
-            api=state["api"],
-            model_name=state["model_name"]
-        )
-        
-        # Summarize papers
-        result = summarizer_tool._run(
-            state["conference"], 
-            state["year"], 
+        # Get paper summarizer tool with LLM configuration
+        summarizer_tool = get_tool("summarizer", state["api"], state["model_name"])
+        
+        # Summarize the batch
+        results = await summarizer_tool._asummarize_batch(
+            papers,
+            state["conference"],
+            state["year"],
             state["topic"]
         )
         
-        if result["status"] != "success":
-            error_msg = f"Failed to summarize papers: {result.get('error', 'Unknown error')}"
-            logging.error(f"[NODE] {error_msg}")
-            return update_state_error(state, error_msg)
-        
-        # Update state with summarization results
-        state["summarized_papers"] = []  # Summaries are saved to files, not stored in memory
-        state["summary_directory"] = f"{state['conference']}_{state['year']}/{state['topic']}" if state["topic"] else f"{state['conference']}_{state['year']}"
-        state["papers_summarized_count"] = result.get("successful_summaries", 0)
-        state["status"] = "completed"
+    except Exception as e:
+        logging.exception(f"[NODE] Error in summarize_batch_node for {len(papers)} papers: {e}")
+        results = [{"status": "error", "error": str(e)}] * len(papers)
+    
+    successful = sum(1 for result in results if result.get("status") == "success")
+    return {
+        "papers_summarized_count": successful,
+        "papers_summary_failed_count": len(results) - successful
+    }
+
+
+async def summarize_papers_node(state: ResearchWorkflowState) -> Command[Literal["aggregate_lang", "handle_error"]]:
+    """
+    Fan-in node collecting the results of the parallel paper summaries.
+    
+    Args:
+        state: Current workflow state
         
-        logging.info(f"[NODE] Summarized {state['papers_summarized_count']} papers")
-        return state
+    Returns:
+        Command with the summarization results, fanning out to per-language aggregation
+    """
+    logging.info(f"[NODE] Collecting paper summaries for {state['conference']} {state['year']}")
+    
+    updates = update_state_progress(state, "summarize_papers")
+    
+    successful = state.get("papers_summarized_count", 0)
+    failed = state.get("papers_summary_failed_count", 0)
+    if not successful and not failed:
+        error_msg = "Failed to summarize papers: No papers found in the list"
+        logging.error(f"[NODE] {error_msg}")
+        return _error_command(state, updates, error_msg)
+    
+    logging.info(f"[NODE] Summarized {successful} papers ({failed} failed)")
+    
+    updates["summary_directory"] = f"{state['conference']}_{state['year']}/{state['topic']}" if state["topic"] else f"{state['conference']}_{state['year']}"
+    updates["status"] = "completed"
+    return Command(update=updates, goto=_aggregation_sends(state))
+
+
+async def aggregate_lang_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker node for aggregating the summaries of one language, dispatched in parallel via Send.
+    
+    Args:
+        state: Send payload with the language and the workflow inputs it needs
         
-    except Exception as e:
-        error_msg = f"Error in summarize_papers_node: {str(e)}"
-        logging.exception(f"[NODE] {error_msg}")
-        return update_state_error(state, error_msg)
+    Returns:
+        Partial update adding this language's result to language_results
+    """
+    language = state["language"]
+    
+    # Get summary aggregator tool
+    aggregator_tool = get_tool("aggregator")
+    
+    result = await aggregator_tool._aaggregate_language(
+        state["conference"],
+        state["year"],
+        state["topic"],
+        language
+    )
+    return {"language_results": {language: result}}
 
 
-def aggregate_summary_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+async def aggregate_summary_node(state: ResearchWorkflowState) -> Command[Literal["finalize_workflow", "handle_error"]]:
     """
-    Node for aggregating paper summaries into structured format.
+    Fan-in node combining the per-language aggregation results.
     
     Args:
         state: Current workflow state
         
     Returns:
-        Updated workflow state with aggregated summary
+        Command with the aggregated summary, going to finalization
     """
     logging.info(f"[NODE] Aggregating summaries for {state['conference']} {state['year']}")
     
+    # Update state to show we're working on summary aggregation
+    updates = update_state_progress(state, "aggregate_summary")
+    
     try:
-        # Update state to show we're working on summary aggregation
-        state = update_state_progress(state, "aggregate_summary")
-        
-        # Initialize summary aggregator tool
-        aggregator_tool = SummaryAggregatorTool()
-        
-        # Aggregate summaries
-        result = aggregator_tool._run(
-            state["conference"], 
-            state["year"], 
-            state["topic"], 
-        )
+        # The per-language results arrive already merged by the language_results reducer
+        language_results = state.get("language_results") or {}
+        total_aggregated = 0
+        for lang_result in language_results.values():
+            total_aggregated += lang_result.get("aggregated_count", 0)
+        result = SummaryAggregatorTool._combine_language_results(language_results)
         
         if result["status"] != "success":
             error_msg = f"Failed to aggregate summaries: {result.get('error', 'Unknown error')}"
             logging.error(f"[NODE] {error_msg}")
-            return update_state_error(state, error_msg)
-        
-        # Update state with aggregation results
-        state["aggregated_summary"] = result
-        
-        # Extract Excel path from successful language results (prefer CH if available)
-        excel_path = ""
-        for lang in ["CH", "EN"]:
-            lang_result = result.get("language_results", {}).get(lang, {})
-            if lang_result.get("status") == "success" and lang_result.get("excel_path"):
-                excel_path = lang_result["excel_path"]
-                break
-        
-        state["excel_output_path"] = excel_path
-        state["status"] = "completed"
-        
-        total_aggregated = sum(
-            lang_result.get("aggregated_count", 0)
-            for lang_result in result.get("language_results", {}).values()
+            return _error_command(state, updates, error_msg)
+        
+        # Extract Excel path from the first successful language result (prefer CH if available)
+        excel_path = next(
+            (
+                lang_result["excel_path"]
+                for lang_result in (language_results.get(lang, {}) for lang in SUMMARY_LANGUAGES)
+                if lang_result.get("status") == "success" and lang_result.get("excel_path")
+            ),
+            ""
         )
         logging.info(f"[NODE] Aggregated {total_aggregated} summaries into Excel files")
-        return state
+        
+        updates["aggregated_summary"] = result
+        updates["excel_output_path"] = excel_path
+        updates["status"] = "completed"
+        return Command(update=updates, goto="finalize_workflow")
         
     except Exception as e:
         error_msg = f"Error in aggregate_summary_node: {str(e)}"
         logging.exception(f"[NODE] {error_msg}")
-        return update_state_error(state, error_msg)
+        return _error_command(state, updates, error_msg)
 
 
-def finalize_workflow_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+async def finalize_workflow_node(state: ResearchWorkflowState) -> Dict[str, Any]:
     """
     Final node to complete the workflow and prepare results.
     
@@ -273,17 +458,20 @@ def finalize_workflow_node(state: ResearchWorkflowState) -> ResearchWorkflowStat
         state: Current workflow state
         
     Returns:
-        Final workflow state with completion status
+        Partial state update with completion status
     """
     logging.info("[NODE] Finalizing workflow")
     
+    # Update state to show completion
+    updates = update_state_progress(state, "finalize", "completed")
+    
     try:
-        # Update state to show completion
-        state = update_state_progress(state, "finalize", "completed")
+        # The workflow is complete only once aggregation produced a summary and an Excel report
+        if not state.get("aggregated_summary") or not state.get("excel_output_path"):
+            raise ValueError("Workflow finalized without an aggregated summary or Excel report")
         
-        # Add completion timestamp if not already set
-        if state.get("processing_time") is None:
-            state["processing_time"] = time.time()
+        # Record elapsed run time
+        updates["processing_time"] = time.perf_counter() - state["start_perf_counter"]
         
         # Prepare final summary
         workflow_summary = {
@@ -303,16 +491,17 @@ def finalize_workflow_node(state: ResearchWorkflowState) -> ResearchWorkflowStat
                 "summaries": state["summary_directory"],
                 "excel_report": state["excel_output_path"]
             },
-            "completion_time": datetime.now().isoformat()
+            "completion_time": datetime.now(timezone.utc).isoformat(timespec="seconds")
         }
         
         # Add language-specific aggregation results if available
         if state.get("aggregated_summary") and state["aggregated_summary"].get("language_results"):
             workflow_summary["aggregation_results"] = state["aggregated_summary"]["language_results"]
         
-        state["aggregated_summary"] = workflow_summary
+        updates["aggregated_summary"] = workflow_summary
+        updates["is_complete"] = True
         logging.info("[NODE] Workflow completed successfully")
-        return state
+        return updates
         
     except Exception as e:
         error_msg = f"Error in finalize_workflow_node: {str(e)}"
@@ -320,7 +509,7 @@ def finalize_workflow_node(state: ResearchWorkflowState) -> ResearchWorkflowStat
         return update_state_error(state, error_msg)
 
 
-def error_handler_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
+async def error_handler_node(state: ResearchWorkflowState) -> Dict[str, Any]:
     """
     Node to handle errors and provide graceful failure.
     
@@ -328,12 +517,12 @@ def error_handler_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
         state: Current workflow state with error
         
     Returns:
-        Updated state with error information
+        Partial state update with error information
     """
     logging.error(f"[NODE] Error handler triggered: {state.get('error_message', 'Unknown error')}")
     
     # Add error timestamp
-    state["error_timestamp"] = datetime.now().isoformat()
+    error_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
     
     # Prepare error summary
     error_summary = {
@@ -343,8 +532,10 @@ def error_handler_node(state: ResearchWorkflowState) -> ResearchWorkflowState:
         "topic": state["topic"],
         "current_step": state["current_step"],
         "error_message": state["error_message"],
-        "error_timestamp": state["error_timestamp"]
+        "error_timestamp": error_timestamp
     }
     
-    state["aggregated_summary"] = error_summary
-    return state
\ No newline at end of file
+    return {
+        "aggregated_summary": error_summary,
+        "processing_time": time.perf_counter() - state["start_perf_counter"]
+    }
\ No newline at end of file
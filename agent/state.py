@@ -1,8 +1,24 @@
-from typing import Dict, List, Any, Optional, TypedDict
+from typing import Annotated, Dict, List, Any, Optional, TypedDict
+import operator
+import time
 from langgraph.graph import StateGraph, END
 from pydantic import BaseModel, Field
 
 
+def merge_dicts(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reducer merging the dicts written by parallel branches into one.
+    
+    Args:
+        left: Current value of the channel
+        right: Value written by a branch
+        
+    Returns:
+        Merged dict, with keys from right taking precedence
+    """
+    return {**(left or {}), **(right or {})}
+
+
 class ResearchWorkflowState(TypedDict):
     """
     State for the research trend analysis workflow.
@@ -21,17 +37,18 @@ class ResearchWorkflowState(TypedDict):
     # Workflow control flags
     skip_keyword_generation: bool
     skip_crawling: bool
+    batch_size: int
     
     # Workflow progress tracking
     current_step: str
     status: str  # "pending", "in_progress", "completed", "error"
+    is_complete: bool  # Set by finalize_workflow once all outputs are in place
     error_message: Optional[str]
     
     # Data generated during workflow
     generated_keywords: Optional[List[str]]
-    crawled_papers: Optional[List[Dict[str, Any]]]
-    filtered_papers: Optional[List[Dict[str, Any]]]
-    summarized_papers: Optional[List[Dict[str, Any]]]
+    # Channel written by the parallel aggregate branches, combined by its reducer
+    language_results: Annotated[Dict[str, Dict[str, Any]], merge_dicts]
     aggregated_summary: Optional[Dict[str, Any]]
     
     # File paths and metadata
@@ -44,13 +61,18 @@ class ResearchWorkflowState(TypedDict):
     # Statistics and metrics
     papers_crawled_count: int
     papers_filtered_count: int
-    papers_summarized_count: int
-    processing_time: Optional[float]
+    papers_summarized_count: Annotated[int, operator.add]  # Each summarize branch adds its successes
+    papers_summary_failed_count: Annotated[int, operator.add]  # ...and its failures
+    start_perf_counter: float  # time.perf_counter() when the run started
+    processing_time: Optional[float]  # Elapsed seconds, set when the run ends
 
 
 class ResearchWorkflowConfig(BaseModel):
     """
     Configuration for the research trend analysis workflow.
+    Resuming a run from a checkpoint is not supported: the graph has no
+    checkpointer; intermediate results are persisted by the nodes themselves
+    (keyword, paper list and summary files).
     """
     conference: str = Field(..., description="Conference name (e.g., 'neurips', 'popets')")
     year: int = Field(..., description="Conference year")
@@ -92,6 +114,10 @@ class ResearchWorkflowConfig(BaseModel):
         default=None, 
         description="Maximum number of papers to process (for testing)"
     )
+    batch_size: int = Field(
+        default=8,
+        description="Number of papers summarized concurrently in one parallel branch"
+    )
 
 
 def initialize_workflow_state(config: ResearchWorkflowConfig) -> ResearchWorkflowState:
@@ -117,15 +143,15 @@ def initialize_workflow_state(config: ResearchWorkflowConfig) -> ResearchWorkflo
         # Workflow control flags
         "skip_keyword_generation": config.skip_keyword_generation,
         "skip_crawling": config.skip_crawling,
+        "batch_size": config.batch_size,
         
         "current_step": "initialize",
         "status": "pending",
+        "is_complete": False,
         "error_message": None,
         
         "generated_keywords": None,
-        "crawled_papers": None,
-        "filtered_papers": None,
-        "summarized_papers": None,
+        "language_results": {},
         "aggregated_summary": None,
         
         "keywords_save_path": None,
@@ -137,13 +163,17 @@ def initialize_workflow_state(config: ResearchWorkflowConfig) -> ResearchWorkflo
         "papers_crawled_count": 0,
         "papers_filtered_count": 0,
         "papers_summarized_count": 0,
+        "papers_summary_failed_count": 0,
+        "start_perf_counter": time.perf_counter(),
         "processing_time": None
     }
 
 
-def update_state_progress(state: ResearchWorkflowState, step: str, status: str = "in_progress") -> ResearchWorkflowState:
+def update_state_progress(state: ResearchWorkflowState, step: str, status: str = "in_progress") -> Dict[str, Any]:
     """
-    Update the workflow state with current progress.
+    Build the partial state update recording current progress.
+    Nodes return partial updates and langgraph merges them into the state,
+    so the full state is never copied.
     
     Args:
         state: Current workflow state
@@ -151,28 +181,26 @@ def update_state_progress(state: ResearchWorkflowState, step: str, status: str =
         status: Current status ("in_progress", "completed", "error")
         
     Returns:
-        Updated workflow state
+        Partial state update
     """
     return {
-        **state,
         "current_step": step,
         "status": status
     }
 
 
-def update_state_error(state: ResearchWorkflowState, error_message: str) -> ResearchWorkflowState:
+def update_state_error(state: ResearchWorkflowState, error_message: str) -> Dict[str, Any]:
     """
-    Update the workflow state with an error.
+    Build the partial state update recording an error.
     
     Args:
         state: Current workflow state
         error_message: Error message to store
         
     Returns:
-        Updated workflow state with error
+        Partial state update with error
     """
     return {
-        **state,
         "status": "error",
         "error_message": error_message
     }
@@ -188,11 +216,7 @@ def is_workflow_complete(state: ResearchWorkflowState) -> bool:
     Returns:
         True if workflow is complete, False otherwise
     """
-    return (
-        state.get("status") == "completed" and
-        state.get("aggregated_summary") is not None and
-        state.get("excel_output_path") is not None
-    )
+    return state.get("is_complete", False)
 
 
 def get_workflow_summary(state: ResearchWorkflowState) -> Dict[str, Any]:
@@ -5,4 +5,4 @@ Contains configuration classes and utilities for the langgraph-based agent syste
 
 from .log_config import configure_logging
 
-__all__ = ['LLMProviderConfig', 'configure_logging']
\ No newline at end of file
+__all__ = ['configure_logging']
\ No newline at end of file
@@ -13,6 +13,9 @@ class Config:
     # Google API 密钥
     GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY', '')
 
+    # Upper bound on LLM calls in flight at once across the whole process
+    LLM_MAX_CONCURRENT_CALLS = int(os.getenv('LLM_MAX_CONCURRENT_CALLS', '8'))
+
     # 代理配置
     PROXY_ID = os.getenv('PROXY_ID', '')
     PROXY_PW = os.getenv('PROXY_PW', '')
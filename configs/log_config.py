@@ -3,14 +3,21 @@ Logging configuration for Research Trend Analyzer Agent.
 Adapted for langchain framework compatibility.
 """
 
+import atexit
 import logging
 import os
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Settings and handlers of the last configure_logging call, so repeated calls are no-ops
+_active_settings: Optional[Tuple] = None
+_active_handlers: List[logging.Handler] = []
+# Background thread that writes queued records to the log file
+_file_listener: Optional[QueueListener] = None
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels."""
@@ -24,11 +31,21 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Color codes indexed by levelno // 10 (DEBUG=10 ... CRITICAL=50), resolved once
+        self._level_colors = ("",) + tuple(
+            self.COLORS[name] for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+        )
+        self._reset = self.COLORS['RESET']
+    
     def format(self, record):
         log_message = super().format(record)
-        if record.levelname in self.COLORS:
-            return f"{self.COLORS[record.levelname]}{log_message}{self.COLORS['RESET']}"
-        return log_message
+        levelno = record.levelno
+        # Custom levels between the standard ones stay uncolored
+        if levelno % 10 or not 10 <= levelno <= 50:
+            return log_message
+        return self._level_colors[levelno // 10] + log_message + self._reset
 
 def configure_logging(
     console: bool = True,
@@ -47,11 +64,20 @@ def configure_logging(
         log_file: Path to log file (optional)
         file_level: Log level for file output
     """
-    # Clear existing handlers
-    logging.getLogger().handlers.clear()
+    global _active_settings, _active_handlers, _file_listener
     
-    # Create root logger
+    settings = (console, console_level, colored_console, log_file, file_level)
     logger = logging.getLogger()
+    if settings == _active_settings and logger.handlers == _active_handlers:
+        return
+    
+    # Clear existing handlers (closing them, so reconfiguring does not leak open log files)
+    _stop_file_listener()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    
+    # Configure root logger
     logger.setLevel(logging.DEBUG)
     
     # Console handler
@@ -76,8 +102,7 @@ def configure_logging(
     # File handler
     if log_file:
         # Ensure log directory exists
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_log_dir(str(Path(log_file).parent))
         
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(file_level)
@@ -86,7 +111,35 @@ def configure_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        
+        # Callers only enqueue records; the listener thread does the disk writes
+        queue_handler = QueueHandler(queue.Queue(-1))
+        queue_handler.setLevel(file_level)
+        _file_listener = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
+        logger.addHandler(queue_handler)
+    
+    _active_settings = settings
+    _active_handlers = list(logger.handlers)
+
+@lru_cache(maxsize=32)
+def _ensure_log_dir(log_dir: str) -> None:
+    """Create a log directory once per process instead of on every reconfiguration."""
+    os.makedirs(log_dir, exist_ok=True)
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and stop the listener thread, if one is running."""
+    global _file_listener
+    
+    if _file_listener is None:
+        return
+    _file_listener.stop()
+    for handler in _file_listener.handlers:
+        handler.close()
+    _file_listener = None
+
+
+atexit.register(_stop_file_listener)
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -100,19 +153,39 @@ def get_logger(name: str) -> logging.Logger:
     """
     return logging.getLogger(name)
 
-# Default logging configuration
-def setup_default_logging():
-    """Set up default logging configuration from environment variables."""
+# Log level names accepted in LOG_LEVEL
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+@lru_cache(maxsize=1)
+def _log_settings() -> Tuple[str, int]:
+    """Read LOG_FILE and LOG_LEVEL (loading .env once) and return (log_file, console_level)."""
+    load_dotenv()
     log_file = os.getenv('LOG_FILE', 'logs/app.log')
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    return log_file, _LOG_LEVELS.get(log_level, logging.INFO)
+
+def reset_log_settings() -> None:
+    """Forget the cached environment settings so the next setup_default_logging re-reads them."""
+    _log_settings.cache_clear()
+
+# Default logging configuration
+def setup_default_logging():
+    """
+    Set up default logging configuration from environment variables.
+    Entry points call this (or configure_logging) explicitly; importing this module has no side effects.
+    """
+    log_file, log_level = _log_settings()
     
     configure_logging(
         console=True,
-        console_level=getattr(logging, log_level, logging.INFO),
+        console_level=log_level,
         colored_console=True,
         log_file=log_file,
         file_level=logging.DEBUG
-    )
-
-# Initialize default logging when module is imported
-setup_default_logging()
\ No newline at end of file
+    )
\ No newline at end of file
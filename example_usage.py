@@ -4,9 +4,9 @@ Example usage of the Research Trend Analyzer Light Agent.
 This script demonstrates how to use the agent programmatically.
 """
 
+import asyncio
 import logging
 from configs.log_config import configure_logging
-from agent.graph import run_research_workflow
 
 
 def example_basic_usage():
@@ -37,6 +37,9 @@ def example_basic_usage():
     print(f"  Max Papers: {config.get('max_papers', 'All')}")
     print()
     
+    # Imported here so importing this module does not load langgraph and the tool stack
+    from agent.graph import run_research_workflow
+    
     try:
         # Run the research workflow
         results = run_research_workflow(config)
@@ -100,6 +103,8 @@ def example_advanced_usage():
     
     print("Running advanced workflow with custom configuration...")
     
+    from agent.graph import run_research_workflow
+    
     try:
         results = run_research_workflow(config)
         
@@ -113,6 +118,32 @@ def example_advanced_usage():
         print(f"❌ Fatal error in advanced workflow: {e}")
 
 
+def example_batch_usage():
+    """Example of analyzing several conferences concurrently."""
+    print("\n=== Batch Usage Example ===\n")
+    
+    # One configuration per (conference, year) to sweep; the workflows share the cached agent
+    configs = [
+        {"conference": conference, "year": 2024, "topic": "privacy", "max_papers": 5}
+        for conference in ("neurips", "popets", "usenix_security")
+    ]
+    
+    print(f"Running {len(configs)} workflows concurrently...")
+    
+    from agent.graph import run_many
+    
+    try:
+        all_results = asyncio.run(run_many(configs, max_concurrent=3))
+        
+        for config, results in zip(configs, all_results):
+            status = results.get("status", "unknown")
+            summarized = results.get("papers_processed", {}).get("summarized", 0)
+            print(f"  {config['conference']} {config['year']}: {status} ({summarized} papers summarized)")
+            
+    except Exception as e:
+        print(f"❌ Fatal error in batch workflow: {e}")
+
+
 def example_error_handling():
     """Example demonstrating error handling."""
     print("\n=== Error Handling Example ===\n")
@@ -126,6 +157,8 @@ def example_error_handling():
     
     print("Running workflow with invalid conference...")
     
+    from agent.graph import run_research_workflow
+    
     try:
         results = run_research_workflow(config)
         
@@ -143,6 +176,7 @@ if __name__ == "__main__":
     # Run the examples
     example_basic_usage()
     example_advanced_usage()
+    example_batch_usage()
     example_error_handling()
     
     print("\n=== Example Usage Complete ===")
@@ -14,9 +14,8 @@ from typing import Dict, Any, Optional
 # Configure logging
 from configs.log_config import configure_logging
 
-# Import the agent components
-from agent.graph import run_research_workflow, get_workflow_visualization
-from agent.state import ResearchWorkflowConfig
+# The agent components (langgraph, langchain and the tool stack) are imported where they are
+# first needed, so `--help` and argument errors return without loading them
 
 
 def parse_arguments():
@@ -58,6 +57,8 @@ def parse_arguments():
                        help="Skip paper crawling if papers already exist")
     parser.add_argument("--max-papers", type=int,
                        help="Maximum number of papers to process (for testing)")
+    parser.add_argument("--batch-size", type=int,
+                       help="Number of papers summarized concurrently in one batch (default: 8)")
     
     # Output and logging
     parser.add_argument("--output", "-o", 
@@ -94,6 +95,8 @@ def create_config_from_args(args) -> Dict[str, Any]:
         config["temp_pdf_root"] = args.temp_pdf_root
     if args.max_papers:
         config["max_papers"] = args.max_papers
+    if args.batch_size:
+        config["batch_size"] = args.batch_size
     
     return config
 
@@ -108,8 +111,17 @@ def save_results(results: Dict[str, Any], output_path: str):
         logging.error(f"Failed to save results to {output_path}: {e}")
 
 
+def print_progress(event: Dict[str, Any]):
+    """Print the status of each workflow step as it finishes."""
+    for node, update in event.items():
+        status = update.get("status") if isinstance(update, dict) else None
+        print(f"[{node}] {status or 'done'}")
+
+
 def display_visualization():
     """Display the workflow graph visualization."""
+    from agent.graph import get_workflow_visualization
+    
     try:
         visualization = get_workflow_visualization()
         if visualization:
@@ -139,6 +151,9 @@ def main():
     logging.info("Starting Research Trend Analyzer Light Agent")
     logging.info(f"Conference: {args.conference}, Year: {args.year}, Topic: {args.topic}")
     
+    from agent.graph import run_research_workflow
+    from agent.state import ResearchWorkflowConfig
+    
     try:
         # Create configuration from arguments
         config = create_config_from_args(args)
@@ -147,7 +162,7 @@ def main():
         ResearchWorkflowConfig(**config)  # This will raise validation errors if invalid
         
         # Run the research workflow
-        results = run_research_workflow(config)
+        results = run_research_workflow(config, progress_callback=print_progress)
         
         # Display results
         print("\n=== Workflow Results ===")
@@ -4,20 +4,33 @@ Basic tests for the Research Trend Analyzer Light Agent workflow.
 These tests verify the core functionality without making actual API calls.
 """
 
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 import json
 import tempfile
+import time
 import shutil
 
-from agent.state import ResearchWorkflowConfig, initialize_workflow_state
+from agent.state import (
+    ResearchWorkflowConfig,
+    initialize_workflow_state,
+    update_state_progress,
+    update_state_error,
+    merge_dicts
+)
 from agent.nodes import (
     generate_keywords_node,
     crawl_papers_node,
     filter_papers_node,
+    summarize_batch_node,
     summarize_papers_node,
-    aggregate_summary_node
+    aggregate_lang_node,
+    aggregate_summary_node,
+    finalize_workflow_node,
+    NodeFailedError,
+    TransientToolError
 )
 
 
@@ -45,6 +58,28 @@ class TestWorkflowState(unittest.TestCase):
         self.assertEqual(state["language"], "CH")
         self.assertEqual(state["status"], "pending")
         self.assertEqual(state["current_step"], "initialize")
+    
+    def test_state_updates_are_partial(self):
+        """Test that progress and error helpers return only the changed keys."""
+        state = {"conference": "popets", "year": 2025, "status": "pending"}
+        
+        self.assertEqual(
+            update_state_progress(state, "crawl_papers"),
+            {"current_step": "crawl_papers", "status": "in_progress"}
+        )
+        self.assertEqual(
+            update_state_error(state, "boom"),
+            {"status": "error", "error_message": "boom"}
+        )
+    
+    def test_merge_dicts_reducer(self):
+        """Test that the dict reducer merges parallel branch writes."""
+        self.assertEqual(merge_dicts({}, {"EN": {"status": "success"}}), {"EN": {"status": "success"}})
+        self.assertEqual(
+            merge_dicts({"EN": {"status": "success"}}, {"CH": {"status": "error"}}),
+            {"EN": {"status": "success"}, "CH": {"status": "error"}}
+        )
+        self.assertEqual(merge_dicts(None, None), {})
 
 
 class TestWorkflowNodes(unittest.TestCase):
@@ -62,11 +97,10 @@ class TestWorkflowNodes(unittest.TestCase):
             "model_name": "gemini-2.5-flash",
             "status": "pending",
             "current_step": "initialize",
+            "is_complete": False,
             "error_message": None,
             "generated_keywords": None,
-            "crawled_papers": None,
-            "filtered_papers": None,
-            "summarized_papers": None,
+            "language_results": {},
             "aggregated_summary": None,
             "keywords_save_path": None,
             "paper_list_path": None,
@@ -76,6 +110,8 @@ class TestWorkflowNodes(unittest.TestCase):
             "papers_crawled_count": 0,
             "papers_filtered_count": 0,
             "papers_summarized_count": 0,
+            "papers_summary_failed_count": 0,
+            "start_perf_counter": time.perf_counter(),
             "processing_time": None
         }
         
@@ -100,8 +136,9 @@ class TestWorkflowNodes(unittest.TestCase):
         """Clean up test fixtures."""
         shutil.rmtree(self.temp_dir)
     
+    @patch('agent.nodes.load_keywords', return_value=[])
     @patch('tools.keywords_generator.KeywordsGeneratorTool._run')
-    def test_generate_keywords_node_success(self, mock_keyword_tool):
+    def test_generate_keywords_node_success(self, mock_keyword_tool, mock_load_keywords):
         """Test successful keyword generation."""
         mock_keyword_tool.return_value = {
             "status": "success",
@@ -111,12 +148,29 @@ class TestWorkflowNodes(unittest.TestCase):
             "keywords_count": 2
         }
         
-        state = generate_keywords_node(self.test_state)
+        command = asyncio.run(generate_keywords_node(self.test_state))
+        state = command.update
         
+        self.assertEqual(command.goto, "crawl_papers")
         self.assertEqual(state["status"], "completed")
         self.assertEqual(state["generated_keywords"], ["dp_theory", "data protection"])
         self.assertEqual(state["keywords_save_path"], "configs/analysis_scope.json")
     
+    @patch('agent.nodes.load_keywords', return_value=["dp_theory", "data protection"])
+    @patch('tools.keywords_generator.KeywordsGeneratorTool._run')
+    def test_generate_keywords_node_reuses_saved_keywords(self, mock_keyword_tool, mock_load_keywords):
+        """Test that saved keywords are reused without calling the LLM."""
+        self.test_state["skip_crawling"] = True
+        
+        command = asyncio.run(generate_keywords_node(self.test_state))
+        state = command.update
+        
+        mock_keyword_tool.assert_not_called()
+        self.assertEqual(command.goto, "filter_papers")
+        self.assertEqual(state["status"], "completed")
+        self.assertEqual(state["generated_keywords"], ["dp_theory", "data protection"])
+        self.assertNotIn("conference", state)
+    
     @patch('tools.paper_crawler.PaperCrawlerTool._run')
     def test_crawl_papers_node_success(self, mock_crawler_tool):
         """Test successful paper crawling."""
@@ -130,14 +184,17 @@ class TestWorkflowNodes(unittest.TestCase):
             "message": "Successfully crawled 5 papers"
         }
         
-        state = crawl_papers_node(self.test_state)
+        command = asyncio.run(crawl_papers_node(self.test_state))
+        state = command.update
         
+        self.assertEqual(command.goto, "filter_papers")
         self.assertEqual(state["status"], "completed")
         self.assertEqual(state["papers_crawled_count"], 5)
         self.assertEqual(state["paper_list_path"], "papers/paper_list/popets_2025/full_list.jsonl")
     
+    @patch('agent.nodes.load_jsonl', return_value=[])
     @patch('tools.paper_filter.PaperFilterTool._run')
-    def test_filter_papers_node_success(self, mock_filter_tool):
+    def test_filter_papers_node_success(self, mock_filter_tool, mock_load_jsonl):
         """Test successful paper filtering."""
         mock_filter_tool.return_value = {
             "status": "success",
@@ -150,59 +207,229 @@ class TestWorkflowNodes(unittest.TestCase):
             "message": "Successfully filtered 3 papers"
         }
         
-        state = filter_papers_node(self.test_state)
+        command = asyncio.run(filter_papers_node(self.test_state))
+        state = command.update
         
+        # Nothing to summarize in the (empty) filtered list, so go straight to the fan-in
+        self.assertEqual(command.goto, "summarize_papers")
         self.assertEqual(state["status"], "completed")
         self.assertEqual(state["papers_filtered_count"], 3)
         self.assertEqual(state["filtered_papers_path"], "papers/paper_list/popets_2025/filtered_dp_theory.jsonl")
     
-    @patch('tools.paper_summarizer.PaperSummarizerTool._run')
-    def test_summarize_papers_node_success(self, mock_summarizer_tool):
-        """Test successful paper summarization."""
-        mock_summarizer_tool.return_value = {
+    @patch('tools.paper_summarizer.PaperSummarizerTool._summarize_paper')
+    def test_summarize_batch_node_success(self, mock_summarize_paper):
+        """Test that a summarize_batch worker counts its summarized papers."""
+        mock_summarize_paper.return_value = {
+            "status": "success",
+            "summaries_generated": 2,
+            "languages": ["EN", "CH"]
+        }
+        
+        payload = {
+            "papers": [
+                {"title": "A DP Paper", "paper_url": "https://example.org/a.pdf"},
+                {"title": "Another DP Paper", "paper_url": "https://example.org/b.pdf"}
+            ],
+            "conference": "popets",
+            "year": 2025,
+            "topic": "dp_theory",
+            "api": "gemini",
+            "model_name": "gemini-2.5-flash"
+        }
+        update = asyncio.run(summarize_batch_node(payload))
+        
+        self.assertEqual(mock_summarize_paper.call_count, 2)
+        self.assertEqual(update, {"papers_summarized_count": 2, "papers_summary_failed_count": 0})
+    
+    @patch('tools.keywords_generator.get_llm')
+    def test_keywords_parsed_from_json_reply(self, mock_get_llm):
+        """Test that a fenced JSON keyword reply is parsed into its keyword list."""
+        from tools import keywords_generator
+        
+        mock_llm = MagicMock(return_value={
             "status": "success",
+            "data": '```json\n{"topic": "dp", "definition": "...", "keywords": ["Differential Privacy", "DP-SGD"]}\n```'
+        })
+        mock_get_llm.return_value = mock_llm
+        
+        keywords = keywords_generator.generate_keywords_tool.func("dp_theory")
+        
+        self.assertEqual(keywords, ["differential privacy", "dp-sgd"])
+        mock_llm.assert_called_once()
+    
+    @patch('tools.paper_summarizer.get_llm')
+    @patch('tools.paper_summarizer.download_pdf')
+    def test_existing_summaries_skip_pdf_download(self, mock_download_pdf, mock_get_llm):
+        """Test that a paper whose summaries already exist is not downloaded again."""
+        from tools.paper_summarizer import PaperSummarizerTool
+        from utils.helper_func import safe_filename
+        
+        summary_root = self.papers_dir / "paper_summary"
+        for lang in ("EN", "CH"):
+            (summary_root / lang).mkdir(parents=True)
+            (summary_root / lang / f"{safe_filename('A DP Paper')}.md").write_text("# summary", encoding="utf-8")
+        
+        result = PaperSummarizerTool()._summarize_paper(
+            {"title": "A DP Paper", "paper_url": "https://example.org/a.pdf"},
+            "dp_theory", str(self.scope_file), str(summary_root), str(Path(self.temp_dir) / "pdfs"),
+            "gemini", "gemini-2.5-flash"
+        )
+        
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["summaries_generated"], 0)
+        mock_download_pdf.assert_not_called()
+    
+    @patch('tools.paper_summarizer.delete_pdf')
+    @patch('tools.paper_summarizer.PaperSummarizerTool._generate_summary', return_value=None)
+    @patch('tools.paper_summarizer.parse_pdf', return_value={"status": "success", "message": "", "data": "text"})
+    @patch('tools.paper_summarizer.download_pdf', return_value={"status": "success", "message": "", "data": None})
+    @patch('tools.paper_summarizer.get_llm')
+    def test_summarize_batch_node_counts_no_summaries_as_failed(self, mock_get_llm, mock_download_pdf,
+                                                               mock_parse_pdf, mock_generate_summary,
+                                                               mock_delete_pdf):
+        """Test that a paper whose summaries all fail to generate is not counted as summarized."""
+        from tools.paper_summarizer import PaperSummarizerTool
+        
+        summarizer_tool = PaperSummarizerTool(
+            scope_list_path=str(self.scope_file),
+            paper_list_root=str(self.papers_dir / "paper_list"),
+            paper_summary_root=str(self.papers_dir / "paper_summary"),
+            temp_pdf_root=str(Path(self.temp_dir) / "pdfs")
+        )
+        payload = {
+            "papers": [{"title": "A DP Paper", "paper_url": "https://example.org/a.pdf"}],
             "conference": "popets",
             "year": 2025,
             "topic": "dp_theory",
-            "papers_processed": 3,
-            "successful_summaries": 3,
-            "failed_summaries": 0,
-            "message": "Successfully summarized 3 papers"
+            "api": "gemini",
+            "model_name": "gemini-2.5-flash"
         }
         
-        state = summarize_papers_node(self.test_state)
+        with patch('agent.nodes.get_tool', return_value=summarizer_tool):
+            update = asyncio.run(summarize_batch_node(payload))
+        
+        self.assertEqual(mock_generate_summary.call_count, 2)
+        self.assertEqual(update, {"papers_summarized_count": 0, "papers_summary_failed_count": 1})
+    
+    @patch('tools.paper_summarizer.delete_pdf')
+    @patch('tools.paper_summarizer.PaperSummarizerTool._generate_summary', return_value=None)
+    @patch('tools.paper_summarizer.parse_pdf', return_value={"status": "success", "message": "", "data": "text"})
+    @patch('tools.paper_summarizer.download_pdf', return_value={"status": "success", "message": "", "data": None})
+    @patch('tools.paper_summarizer.get_llm')
+    def test_paper_with_existing_summary_is_not_failed(self, mock_get_llm, mock_download_pdf,
+                                                       mock_parse_pdf, mock_generate_summary, mock_delete_pdf):
+        """Test that a paper keeping its saved CH summary counts as summarized when EN generation fails."""
+        from tools.paper_summarizer import PaperSummarizerTool
+        from utils.helper_func import safe_filename
+        
+        summary_root = self.papers_dir / "paper_summary"
+        (summary_root / "CH").mkdir(parents=True)
+        (summary_root / "CH" / f"{safe_filename('A DP Paper')}.md").write_text("# summary", encoding="utf-8")
         
+        result = PaperSummarizerTool()._summarize_paper(
+            {"title": "A DP Paper", "paper_url": "https://example.org/a.pdf"},
+            "dp_theory", str(self.scope_file), str(summary_root), str(Path(self.temp_dir) / "pdfs"),
+            "gemini", "gemini-2.5-flash"
+        )
+        
+        mock_generate_summary.assert_called_once()
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["missing_languages"], ["EN"])
+        self.assertEqual(list(result["summary_paths"]), ["CH"])
+    
+    def test_summarize_papers_node_success(self):
+        """Test that the summarize fan-in reports the reduced counts."""
+        self.test_state["papers_summarized_count"] = 3
+        self.test_state["papers_summary_failed_count"] = 1
+        
+        command = asyncio.run(summarize_papers_node(self.test_state))
+        state = command.update
+        
+        self.assertEqual([send.node for send in command.goto], ["aggregate_lang", "aggregate_lang"])
         self.assertEqual(state["status"], "completed")
-        self.assertEqual(state["papers_summarized_count"], 3)
+        self.assertNotIn("papers_summarized_count", state)
+        self.assertNotIn("papers_summary_failed_count", state)
     
-    @patch('tools.summary_aggregator.SummaryAggregatorTool._run')
-    def test_aggregate_summary_node_success(self, mock_aggregator_tool):
-        """Test successful summary aggregation."""
-        mock_aggregator_tool.return_value = {
+    @patch('tools.summary_aggregator._aggregate_summaries_impl')
+    def test_aggregate_lang_node_success(self, mock_aggregate_impl):
+        """Test that an aggregate_lang worker writes its result under its language."""
+        mock_aggregate_impl.return_value = {
             "status": "success",
-            "language_results": {
-                "CH": {
-                    "status": "success",
-                    "aggregated_count": 3,
-                    "failed_count": 0,
-                    "excel_path": "papers/paper_summary/popets_2025/privacy/summary.xlsx",
-                    "message": "Aggregated 3 CH summaries"
-                },
-                "EN": {
-                    "status": "success",
-                    "aggregated_count": 3,
-                    "failed_count": 0,
-                    "excel_path": "papers/paper_summary/popets_2025/privacy/summary_EN.xlsx",
-                    "message": "Aggregated 3 EN summaries"
-                }
+            "aggregated_count": 3,
+            "failed_count": 0,
+            "excel_path": "papers/paper_summary/popets_2025/privacy/EN/summary.xlsx",
+            "message": "Aggregated 3 EN summaries"
+        }
+        
+        payload = {"language": "EN", "conference": "popets", "year": 2025, "topic": "dp_theory"}
+        update = asyncio.run(aggregate_lang_node(payload))
+        
+        self.assertEqual(list(update["language_results"]), ["EN"])
+        self.assertEqual(update["language_results"]["EN"]["aggregated_count"], 3)
+    
+    def test_excel_list_cells_do_not_depend_on_writer(self):
+        """Test that list cells reach the pandas fallback joined, as the xlsxwriter path writes them."""
+        import sys
+        from tools import summary_aggregator
+        
+        fake_pandas = MagicMock()
+        columns = {column: ["x"] for column in summary_aggregator.SUMMARY_COLUMNS}
+        columns["Keywords"] = [["dp", "sgd"]]
+        with patch.object(summary_aggregator, "EXCEL_STREAMING", False), \
+                patch.dict(sys.modules, {"pandas": fake_pandas}):
+            summary_aggregator._write_excel_report("report.xlsx", columns)
+        
+        written = fake_pandas.DataFrame.call_args[0][0]
+        self.assertEqual(written["Keywords"], ["dp, sgd"])
+        self.assertEqual(columns["Keywords"], [["dp", "sgd"]])
+    
+    def test_aggregate_summary_node_success(self):
+        """Test successful summary aggregation."""
+        self.test_state["language_results"] = {
+            "EN": {
+                "status": "success",
+                "aggregated_count": 3,
+                "failed_count": 0,
+                "excel_path": "papers/paper_summary/popets_2025/privacy/summary_EN.xlsx",
+                "message": "Aggregated 3 EN summaries"
             },
-            "message": "Aggregated summaries for both languages: CH (3), EN (3)"
+            "CH": {
+                "status": "success",
+                "aggregated_count": 3,
+                "failed_count": 0,
+                "excel_path": "papers/paper_summary/popets_2025/privacy/summary.xlsx",
+                "message": "Aggregated 3 CH summaries"
+            }
         }
         
-        state = aggregate_summary_node(self.test_state)
+        command = asyncio.run(aggregate_summary_node(self.test_state))
+        state = command.update
         
+        self.assertEqual(command.goto, "finalize_workflow")
         self.assertEqual(state["status"], "completed")
         self.assertEqual(state["excel_output_path"], "papers/paper_summary/popets_2025/privacy/summary.xlsx")
+    
+    def test_finalize_workflow_node_records_elapsed_time(self):
+        """Test that finalize records elapsed seconds rather than a timestamp."""
+        self.test_state["start_perf_counter"] = time.perf_counter() - 2.0
+        self.test_state["excel_output_path"] = "papers/paper_summary/popets_2025/dp_theory/CH/summary.xlsx"
+        self.test_state["aggregated_summary"] = {"status": "success", "language_results": {}}
+        
+        state = asyncio.run(finalize_workflow_node(self.test_state))
+        
+        self.assertEqual(state["status"], "completed")
+        self.assertTrue(state["is_complete"])
+        self.assertGreaterEqual(state["processing_time"], 2.0)
+        self.assertLess(state["processing_time"], 60.0)
+    
+    def test_finalize_workflow_node_requires_excel_report(self):
+        """Test that finalize fails instead of completing when the Excel report is missing."""
+        self.test_state["aggregated_summary"] = {"status": "success", "language_results": {}}
+        
+        state = asyncio.run(finalize_workflow_node(self.test_state))
+        
+        self.assertEqual(state["status"], "error")
+        self.assertNotIn("is_complete", state)
 
 
 class TestErrorHandling(unittest.TestCase):
@@ -223,19 +450,276 @@ class TestErrorHandling(unittest.TestCase):
             "error_message": None
         }
     
+    @patch('agent.nodes.load_keywords', return_value=[])
     @patch('tools.keywords_generator.KeywordsGeneratorTool._run')
-    def test_generate_keywords_node_error(self, mock_keyword_tool):
-        """Test error handling in keyword generation."""
+    def test_generate_keywords_node_error(self, mock_keyword_tool, mock_load_keywords):
+        """Test that keyword generation failures are raised, so the node cache never stores them."""
         mock_keyword_tool.return_value = {
             "status": "error",
             "topic": "dp_theory",
             "error": "Failed to generate keywords"
         }
         
-        state = generate_keywords_node(self.test_state)
+        with self.assertRaises(NodeFailedError) as ctx:
+            asyncio.run(generate_keywords_node(self.test_state))
         
-        self.assertEqual(state["status"], "error")
-        self.assertIn("error", state["error_message"].lower())
+        self.assertEqual(ctx.exception.step, "generate_keywords")
+        self.assertIn("failed to generate keywords", str(ctx.exception).lower())
+    
+    @patch('tools.paper_crawler.PaperCrawlerTool._run')
+    def test_crawl_papers_node_raises_transient_error(self, mock_crawler_tool):
+        """Test that transient tool failures are raised so the node's retry policy runs it again."""
+        mock_crawler_tool.return_value = {
+            "status": "error",
+            "error": "HTTPSConnectionPool(host='example.org', port=443): Read timed out.",
+            "transient": True
+        }
+        
+        with self.assertRaises(TransientToolError):
+            asyncio.run(crawl_papers_node(self.test_state))
+    
+    @patch('tools.paper_crawler.PaperCrawlerTool._run')
+    def test_crawl_error_text_does_not_make_it_transient(self, mock_crawler_tool):
+        """Test that a permanent failure mentioning 'timeout' or 'connection' is not retried."""
+        mock_crawler_tool.return_value = {
+            "status": "error",
+            "error": "HTTP 404 fetching https://example.org/connection-timeout-attacks",
+            "transient": False
+        }
+        
+        with self.assertRaises(NodeFailedError) as ctx:
+            asyncio.run(crawl_papers_node(self.test_state))
+        
+        self.assertNotIsInstance(ctx.exception, TransientToolError)
+    
+    def test_transient_errors_classified_by_type_and_status(self):
+        """Test that is_transient_error looks at exception types and status codes, not messages."""
+        from utils.helper_func import TransientError, is_transient_error
+        
+        rate_limited = RuntimeError("quota")
+        rate_limited.code = 429
+        
+        self.assertTrue(is_transient_error(TimeoutError()))
+        self.assertTrue(is_transient_error(TransientError("HTTP 503")))
+        self.assertTrue(is_transient_error(rate_limited))
+        self.assertFalse(is_transient_error(RuntimeError("Connection refused: timeout 429")))
+
+    def test_update_jsonl_does_not_append_blind(self):
+        """Test that update_jsonl drops malformed lines and never appends to an unreadable file."""
+        from utils.helper_func import update_jsonl
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = Path(tmp_dir) / "papers.jsonl"
+
+        path.write_text('{"title": "A"}\n{broken\n', encoding="utf-8")
+        self.assertEqual(update_jsonl(path, [{"title": "A"}, {"title": "B"}]), 1)
+        self.assertEqual(path.read_text(encoding="utf-8").splitlines(), ['{"title":"A"}', '{"title":"B"}'])
+
+        path.write_text('{"title": "A"}', encoding="utf-8")
+        self.assertEqual(update_jsonl(path, [{"title": "B"}]), 1)
+        self.assertEqual(path.read_text(encoding="utf-8").splitlines(), ['{"title":"A"}', '{"title":"B"}'])
+
+        path.write_bytes(b"\xff\xfe not utf-8")
+        self.assertEqual(update_jsonl(path, [{"title": "C"}]), 0)
+        self.assertEqual(path.read_bytes(), b"\xff\xfe not utf-8")
+
+    def test_concurrent_updates_keep_every_row(self):
+        """Test that concurrent update_jsonl and save_json calls neither lose rows nor leave temp files."""
+        from concurrent.futures import ThreadPoolExecutor
+        from utils.helper_func import update_jsonl, save_json
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = Path(tmp_dir) / "papers.jsonl"
+        path.write_text('{"title": 0}', encoding="utf-8")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            added = list(pool.map(lambda i: update_jsonl(path, [{"title": i}]), range(1, 33)))
+            list(pool.map(lambda i: save_json(Path(tmp_dir) / "scope.json", {"n": i}), range(32)))
+
+        self.assertEqual(sum(added), 32)
+        self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 33)
+        self.assertEqual(sorted(p.name for p in Path(tmp_dir).iterdir()), ["papers.jsonl", "scope.json"])
+
+
+class TestWorkflowGraph(unittest.TestCase):
+    """Test construction of the workflow graph and agent."""
+    
+    def test_agents_share_compiled_graph(self):
+        """Test that the graph is compiled once and the singleton agent is reused."""
+        from agent.graph import ResearchWorkflowAgent, get_research_agent
+        
+        self.assertIs(ResearchWorkflowAgent().graph, ResearchWorkflowAgent().graph)
+        self.assertIs(get_research_agent(), get_research_agent())
+    
+    def test_main_nodes_route_with_command(self):
+        """Test that main nodes have no static edges, since they route by returning a Command."""
+        from agent.graph import get_compiled_graph
+        
+        static_sources = {source for source, _ in get_compiled_graph().builder.edges}
+        for node in ("generate_keywords", "crawl_papers", "filter_papers", "summarize_papers", "aggregate_summary"):
+            self.assertNotIn(node, static_sources)
+    
+    def test_entry_routing_honours_skip_flags(self):
+        """Test that the entry router skips keyword generation and crawling as configured."""
+        from agent.graph import route_entry
+        
+        self.assertEqual(route_entry({"skip_keyword_generation": False, "skip_crawling": True}), "generate")
+        self.assertEqual(route_entry({"skip_keyword_generation": True, "skip_crawling": False}), "crawl")
+        self.assertEqual(route_entry({"skip_keyword_generation": True, "skip_crawling": True}), "skip")
+    
+    def test_keywords_cache_key_depends_on_skip_crawling(self):
+        """Test that cached keyword Commands are not reused across runs routing to different nodes."""
+        from agent.graph import _keywords_cache_key
+        
+        state = {"topic": "dp_theory", "api": "gemini", "model_name": "gemini-2.5-flash"}
+        
+        self.assertNotEqual(
+            _keywords_cache_key({**state, "skip_crawling": False}),
+            _keywords_cache_key({**state, "skip_crawling": True})
+        )
+    
+    @patch('agent.nodes.load_jsonl')
+    def test_summaries_dispatched_in_batches(self, mock_load_jsonl):
+        """Test that papers are dispatched to summarize_batch in batch_size chunks."""
+        from agent.nodes import _summary_sends
+        
+        mock_load_jsonl.return_value = [{"title": f"Paper {i}"} for i in range(5)]
+        state = {
+            "conference": "popets",
+            "year": 2025,
+            "topic": "dp_theory",
+            "api": "gemini",
+            "model_name": "gemini-2.5-flash",
+            "batch_size": 2
+        }
+        
+        sends = _summary_sends(state)
+        
+        self.assertEqual([send.node for send in sends], ["summarize_batch"] * 3)
+        self.assertEqual([len(send.arg["papers"]) for send in sends], [2, 2, 1])
+    
+    @patch('agent.nodes.load_jsonl')
+    def test_duplicate_papers_dispatched_once(self, mock_load_jsonl):
+        """Test that papers sharing a PDF URL are summarized only once."""
+        from agent.nodes import _summary_sends
+        
+        mock_load_jsonl.return_value = [
+            {"title": "Paper A", "paper_url": "https://example.org/a.pdf"},
+            {"title": "Paper A (extended)", "paper_url": "https://example.org/a.pdf"},
+            {"title": "Paper B", "paper_url": "https://example.org/b.pdf"}
+        ]
+        state = {
+            "conference": "popets",
+            "year": 2025,
+            "topic": "dp_theory",
+            "api": "gemini",
+            "model_name": "gemini-2.5-flash",
+            "batch_size": 8
+        }
+        
+        sends = _summary_sends(state)
+        
+        self.assertEqual([paper["title"] for paper in sends[0].arg["papers"]], ["Paper A", "Paper B"])
+
+    def test_progress_callback_receives_node_updates(self):
+        """Test that run_workflow reports each node update and returns the final summary."""
+        from agent.graph import ResearchWorkflowAgent
+        
+        config = {"conference": "popets", "year": 2025, "topic": "dp_theory"}
+        final_state = initialize_workflow_state(ResearchWorkflowConfig(**config))
+        final_state["status"] = "completed"
+        events = [
+            ("updates", {"crawl_papers": {"status": "completed", "papers_crawled_count": 5}}),
+            ("updates", {"filter_papers": {"status": "completed", "papers_filtered_count": 3}}),
+            ("values", final_state)
+        ]
+        
+        async def fake_astream(*args, **kwargs):
+            for event in events:
+                yield event
+        
+        agent = ResearchWorkflowAgent()
+        agent.graph = MagicMock(astream=fake_astream)
+        updates = []
+        
+        results = agent.run_workflow(config, progress_callback=updates.append)
+        
+        self.assertEqual([list(update) for update in updates], [["crawl_papers"], ["filter_papers"]])
+        self.assertEqual(results["status"], "completed")
+    
+    def test_failed_node_is_recorded_through_error_handler(self):
+        """Test that a node raising NodeFailedError still ends the run with a recorded error."""
+        from agent.graph import ResearchWorkflowAgent
+        
+        config = {"conference": "popets", "year": 2025, "topic": "dp_theory"}
+        
+        async def fake_astream(*args, **kwargs):
+            yield ("values", initialize_workflow_state(ResearchWorkflowConfig(**config)))
+            raise NodeFailedError("crawl_papers", "Failed to crawl papers: unsupported conference")
+        
+        agent = ResearchWorkflowAgent()
+        agent.graph = MagicMock(astream=fake_astream)
+        updates = []
+        
+        results = agent.run_workflow(config, progress_callback=updates.append)
+        
+        self.assertEqual([list(update) for update in updates], [["crawl_papers"], ["handle_error"]])
+        self.assertEqual(results["status"], "error")
+        self.assertEqual(results["current_step"], "crawl_papers")
+        self.assertIn("unsupported conference", results["error_message"])
+        self.assertIsNotNone(results["processing_time"])
+
+
+class TestPaperFilter(unittest.TestCase):
+    """Test the paper filter tool."""
+    
+    def test_keyword_filter_matches_any_keyword(self):
+        """Test that keyword filtering keeps titles containing any keyword, case-insensitively."""
+        from tools.paper_filter import PaperFilterTool
+        
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        scope_path = Path(tmp_dir) / "analysis_scope.json"
+        scope_path.write_text(json.dumps({"dp_theory": {"keywords": ["differential privacy", "DP-SGD", "a+b"]}}))
+        papers = [
+            {"title": "Tight Bounds for Differential Privacy"},
+            {"title": "Faster dp-sgd Training"},
+            {"title": "Graph Neural Networks"},
+            {"title": "Why a+b Matters"}
+        ]
+        
+        result = PaperFilterTool()._filter_by_keywords("popets", 2025, "dp_theory", papers, str(scope_path), tmp_dir)
+        
+        self.assertEqual(result["filtered_count"], 3)
+        saved = [json.loads(line)["title"] for line in Path(result["save_path"]).read_text().splitlines()]
+        self.assertEqual(saved, ["Tight Bounds for Differential Privacy", "Faster dp-sgd Training", "Why a+b Matters"])
+
+    @patch('tools.paper_filter.get_llm')
+    def test_llm_filter_keeps_paper_order(self, mock_get_llm):
+        """Test that concurrent LLM filtering keeps relevant papers in list order."""
+        from tools.paper_filter import PaperFilterTool
+        
+        relevant = {"Paper 0", "Paper 3", "Paper 4"}
+        mock_get_llm.return_value = lambda prompt: {
+            "status": "success",
+            "data": "1" if any(title in prompt for title in relevant) else "0"
+        }
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        scope_path = Path(tmp_dir) / "analysis_scope.json"
+        scope_path.write_text(json.dumps({"dp_theory": {"definition": "Differential privacy", "keywords": ["privacy"]}}))
+        papers = [{"title": f"Paper {i}"} for i in range(6)] + [{"title": ""}]
+        
+        tool = PaperFilterTool(max_workers=4)
+        result = tool._filter_by_llm("popets", 2025, "dp_theory", papers, str(scope_path), tmp_dir)
+        
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["filtered_count"], 3)
+        self.assertEqual(result["failed_count"], 1)
+        saved = [json.loads(line)["title"] for line in Path(result["save_path"]).read_text().splitlines()]
+        self.assertEqual(saved, ["Paper 0", "Paper 3", "Paper 4"])
 
 
 class TestConfigurationValidation(unittest.TestCase):
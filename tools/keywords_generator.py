@@ -1,17 +1,16 @@
 from typing import List, Dict, Any, Union
 from pathlib import Path
 import logging
+import asyncio
 import ast
-import json
 import os
 from langchain.tools import BaseTool
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage
 from pydantic import Field
 
 from utils.call_llms import get_llm
-from configs.log_config import configure_logging
-from utils.helper_func import save_jsonl, update_jsonl
+from utils.helper_func import (save_jsonl, update_jsonl, strip_code_block, loads_json, save_json,
+                               file_lock, TransientError, is_transient_error)
 from utils.prompts import KEYWORDS_GENERATION_PROMPT
 
 
@@ -45,13 +44,10 @@ def generate_keywords_tool(topic: str, model_name: str = "gemini-2.5-flash", api
         # Call the LLM function
         resp_msg = llm_func(prompt)
         if resp_msg.get("status") != "success":
-            if "RESOURCE_EXHAUSTED" in resp_msg.get("message", ""):
-                msg = "[KEYWORD_GEN] LLM resource exhausted; stopping further calls."
-                logging.error(msg)
-                raise RuntimeError(msg)
+            # Rate limits and unavailable services are flagged transient by the inference function
             msg = f"LLM call failed: {resp_msg.get('message', 'unknown error')}"
             logging.error(f"[KEYWORD_GEN] {msg}")
-            raise RuntimeError(msg)
+            raise (TransientError if resp_msg.get("transient") else RuntimeError)(msg)
         
         # Extract text from response
         response_text = resp_msg.get("data", "")
@@ -61,16 +57,22 @@ def generate_keywords_tool(topic: str, model_name: str = "gemini-2.5-flash", api
             logging.error(f"[KEYWORD_GEN] {msg}")
             raise ValueError(msg)
         
-        # Parse as Python list
-        response_text = response_text.strip()
+        # Parse as JSON, falling back to a Python literal for list-style replies
+        response_text = strip_code_block(response_text)
         try:
-            parsed = ast.literal_eval(response_text)
-            logging.info("[KEYWORD_GEN] Parsed with ast.literal_eval.")
-        except Exception as e_ast:
-            msg = f"response_text cannot be parsed into a Python list: {response_text!r}"
-            logging.exception(f"[KEYWORD_GEN] {msg}")
-            raise ValueError(msg) from e_ast
+            parsed = loads_json(response_text)
+        except ValueError:
+            try:
+                parsed = ast.literal_eval(response_text)
+                logging.info("[KEYWORD_GEN] Parsed with ast.literal_eval.")
+            except Exception as e_ast:
+                msg = f"response_text cannot be parsed into a keyword list: {response_text!r}"
+                logging.exception(f"[KEYWORD_GEN] {msg}")
+                raise ValueError(msg) from e_ast
 
+        # The prompt asks for {"topic", "definition", "keywords"}; a bare list is accepted as well
+        if isinstance(parsed, dict):
+            parsed = parsed.get("keywords")
         if not isinstance(parsed, list):
             raise ValueError("Model output is not a list.")
 
@@ -117,29 +119,66 @@ def save_keywords_tool(topic: str, keywords: List[str], scope_list_path: str = N
     if path.suffix.lower() != ".json":
         path = path.with_suffix(".json")
     
-    data: Dict[str, List[str]] = {}
-    if path.exists():
+    # Concurrent workflow runs share this file, so hold its lock from read to write
+    with file_lock(path):
+        data: Dict[str, List[str]] = {}
+        if path.exists():
+            try:
+                loaded = loads_json(path.read_bytes())
+                if isinstance(loaded, dict):
+                    data = {str(k).lower(): (v if isinstance(v, list) else []) for k, v in loaded.items()}
+            except Exception as e:
+                logging.exception(f"[KEYWORD_GEN] Failed to read {path}: {e}")
+    
+        old_set = {kw.strip().lower() for kw in data.get(topic_key, []) if isinstance(kw, str)}
+        if new_set <= old_set:
+            logging.info(f"[KEYWORD_GEN] No new keywords for topic '{topic_key}'; {path} left unchanged.")
+            return f"No new keywords for topic '{topic_key}'; {len(old_set)} keywords already saved in {path}"
+        merged = sorted(old_set | new_set)
+        data[topic_key] = merged
+    
         try:
-            with path.open("r", encoding="utf-8") as f:
-                loaded = json.load(f)
-            if isinstance(loaded, dict):
-                data = {str(k).lower(): (v if isinstance(v, list) else []) for k, v in loaded.items()}
+            save_json(path, data)
+            logging.info(f"[KEYWORD_GEN] Saved {len(merged)} keywords for topic '{topic_key}' to {path}")
+            return f"Successfully saved {len(merged)} keywords for topic '{topic_key}' to {path}"
         except Exception as e:
-            logging.exception(f"[KEYWORD_GEN] Failed to read {path}: {e}")
+            logging.exception(f"[KEYWORD_GEN] Failed to save keywords: {e}")
+            raise
+
+
+def load_keywords(topic: str, scope_list_path: str = None) -> List[str]:
+    """
+    Load the keywords already saved for a topic.
+    
+    Args:
+        topic: The research topic
+        scope_list_path: Path to the keywords JSON file (optional)
+        
+    Returns:
+        List of saved keywords, empty if the topic has none or the file cannot be read
+    """
+    topic_key = (topic or "").strip().lower()
+    if scope_list_path is None:
+        scope_list_path = os.path.join("configs", "analysis_scope.json")
     
-    old_set = {kw.strip().lower() for kw in data.get(topic_key, []) if isinstance(kw, str)}
-    merged = sorted(old_set | new_set)
-    data[topic_key] = merged
+    path = Path(scope_list_path)
+    if not topic_key or not path.is_file():
+        return []
     
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        logging.info(f"[KEYWORD_GEN] Saved {len(merged)} keywords for topic '{topic_key}' to {path}")
-        return f"Successfully saved {len(merged)} keywords for topic '{topic_key}' to {path}"
+        scope = loads_json(path.read_bytes())
     except Exception as e:
-        logging.exception(f"[KEYWORD_GEN] Failed to save keywords: {e}")
-        raise
+        logging.warning(f"[KEYWORD_GEN] Failed to read {path}: {e}")
+        return []
+    
+    if not isinstance(scope, dict):
+        return []
+    entry = scope.get(topic) or scope.get(topic_key)
+    # Topics are stored either as {"definition": ..., "keywords": [...]} or as a plain keyword list
+    keywords = entry.get("keywords", []) if isinstance(entry, dict) else entry
+    if not isinstance(keywords, list):
+        return []
+    return [k.strip().lower() for k in keywords if isinstance(k, str) and k.strip()]
 
 
 class KeywordsGeneratorTool(BaseTool):
@@ -180,12 +219,13 @@ class KeywordsGeneratorTool(BaseTool):
             logging.exception(f"[KEYWORD_GEN] Failed to process topic={topic!r}: {e}")
             return {
                 "status": "error",
-                "error": str(e)
+                "error": str(e),
+                "transient": is_transient_error(e)
             }
     
     async def _arun(self, topic: str) -> Dict[str, Any]:
-        """Async version of the tool"""
-        return self._run(topic)
+        """Async version of the tool; runs the blocking implementation in a worker thread"""
+        return await asyncio.to_thread(self._run, topic)
 
 
 # Export the tools for easy access
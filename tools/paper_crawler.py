@@ -2,13 +2,13 @@ from typing import List, Dict, Any, Union
 from pathlib import Path
 import os
 import logging
+import asyncio
 from langchain.tools import BaseTool
 from langchain_core.tools import tool
 from pydantic import Field
 
-from configs.log_config import configure_logging
 from utils.paper_process import fetch_papers
-from utils.helper_func import load_jsonl, save_jsonl, update_jsonl
+from utils.helper_func import load_jsonl, save_jsonl, update_jsonl, is_transient_error
 
 
 class PaperCrawlerTool(BaseTool):
@@ -44,6 +44,7 @@ class PaperCrawlerTool(BaseTool):
                 return {
                     "status": "error",
                     "error": msg,
+                    "transient": crawl_res.get("transient", False),
                     "papers_count": 0
                 }
             
@@ -71,12 +72,13 @@ class PaperCrawlerTool(BaseTool):
             return {
                 "status": "error",
                 "error": str(e),
+                "transient": is_transient_error(e),
                 "papers_count": 0
             }
     
     async def _arun(self, conference: str, year: int) -> Dict[str, Any]:
-        """Async version of the tool"""
-        return self._run(conference, year)
+        """Async version of the tool; runs the blocking implementation in a worker thread"""
+        return await asyncio.to_thread(self._run, conference, year)
 
 
 # Export the tools for easy access
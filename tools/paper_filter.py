@@ -1,17 +1,18 @@
 from typing import Any, Dict, List, Union, Optional, Tuple
 from pathlib import Path
 import os
+import re
 import json
 import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from langchain.tools import BaseTool
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage
 from pydantic import Field
 from tqdm import tqdm
 
 from utils.call_llms import get_llm
-from configs.log_config import configure_logging
-from utils.helper_func import load_jsonl, save_jsonl, update_jsonl
+from utils.helper_func import load_jsonl, save_jsonl, update_jsonl, is_transient_error
 from utils.prompts import PAPER_FILTER_PROMPT
 from utils.paper_process import paper_matches_topic
 
@@ -63,6 +64,7 @@ class PaperFilterTool(BaseTool):
                                description="Root directory for paper lists")
     api: str = Field(default="gemini", description="API to use for LLM calls")
     model_name: str = Field(default="gemini-2.5-flash", description="Model name for LLM calls")
+    max_workers: int = Field(default=8, description="Number of papers judged by the LLM concurrently")
     
     def _run(self, conference: str, year: int, topic: str, method: str = "keyword") -> Dict[str, Any]:
         """
@@ -147,7 +149,8 @@ class PaperFilterTool(BaseTool):
                     "filtered_count": 0
                 }
             
-            # Filter papers
+            # Filter papers; one alternation over all keywords scans each title once
+            kw_pattern = re.compile("|".join(re.escape(kw) for kw in sorted(kw_set, key=len, reverse=True)))
             filtered_papers = []
             for paper in tqdm(paper_list, desc=f"[keyword] {topic}"):
                 if not isinstance(paper, dict):
@@ -157,7 +160,7 @@ class PaperFilterTool(BaseTool):
                 if not title:
                     continue
                     
-                if any(kw in title for kw in kw_set):
+                if kw_pattern.search(title):
                     filtered_papers.append(paper)
             
             # Save filtered papers
@@ -186,6 +189,7 @@ class PaperFilterTool(BaseTool):
             return {
                 "status": "error",
                 "error": str(e),
+                "transient": is_transient_error(e),
                 "filtered_count": 0
             }
 
@@ -244,39 +248,18 @@ class PaperFilterTool(BaseTool):
                 title="{title}"
             )
             
-            # Filter papers using LLM
+            # Filter papers using LLM; the calls are network-bound, so judge several papers at once
+            papers = [paper for paper in paper_list if isinstance(paper, dict)]
             filtered_papers = []
             failed_count = 0
             
-            for paper in tqdm(paper_list, desc=f"[llm] {topic}"):
-                if not isinstance(paper, dict):
-                    continue
-                    
-                title = str(paper.get("title", "")).strip()
-                if not title:
-                    failed_count += 1
-                    continue
-                
-                try:
-                    # Call LLM function for decision
-                    paper_prompt = prompt_template.format(title=title)
-                    resp_msg = llm_func(paper_prompt)
-                    if resp_msg.get("status") != "success":
-                        logging.warning(f"[PAPER_FILTER] LLM filtering failed for '{title}': {resp_msg.get('message')}")
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                judgements = executor.map(lambda paper: self._judge_paper(llm_func, prompt_template, paper), papers)
+                for paper, (ok, decision) in zip(papers, tqdm(judgements, total=len(papers), desc=f"[llm] {topic}")):
+                    if not ok:
                         failed_count += 1
-                        continue
-                    
-                    response_text = resp_msg.get("data", "")
-                    
-                    # Parse LLM decision (simple heuristic)
-                    decision = _parse_llm_decision(response_text)
-                    
-                    if decision is True:
+                    elif decision is True:
                         filtered_papers.append(paper)
-                        
-                except Exception as e:
-                    logging.warning(f"[PAPER_FILTER] LLM filtering failed for '{title}': {e}")
-                    failed_count += 1
             
             # Save filtered papers
             conf_key = (conference or "").strip().lower()
@@ -305,12 +288,44 @@ class PaperFilterTool(BaseTool):
             return {
                 "status": "error",
                 "error": str(e),
+                "transient": is_transient_error(e),
                 "filtered_count": 0
             }
 
+    @staticmethod
+    def _judge_paper(llm_func, prompt_template: str, paper: Dict[str, Any]) -> Tuple[bool, Optional[bool]]:
+        """
+        Ask the LLM whether a single paper is relevant to the topic.
+
+        Args:
+            llm_func: LLM function returned by get_llm
+            prompt_template: Filter prompt with a {title} placeholder
+            paper: Paper record
+
+        Returns:
+            Tuple of (call succeeded, parsed decision or None if undecidable)
+        """
+        title = str(paper.get("title", "")).strip()
+        if not title:
+            return False, None
+        
+        try:
+            # Call LLM function for decision
+            resp_msg = llm_func(prompt_template.format(title=title))
+            if resp_msg.get("status") != "success":
+                logging.warning(f"[PAPER_FILTER] LLM filtering failed for '{title}': {resp_msg.get('message')}")
+                return False, None
+            
+            # Parse LLM decision (simple heuristic)
+            return True, _parse_llm_decision(resp_msg.get("data", ""))
+            
+        except Exception as e:
+            logging.warning(f"[PAPER_FILTER] LLM filtering failed for '{title}': {e}")
+            return False, None
+
     async def _arun(self, conference: str, year: int, topic: str, method: str = "keyword") -> Dict[str, Any]:
-        """Async version of the tool"""
-        return self._run(conference, year, topic, method)
+        """Async version of the tool; runs the blocking implementation in a worker thread"""
+        return await asyncio.to_thread(self._run, conference, year, topic, method)
 
 
 # Export the tools for easy access
@@ -1,20 +1,51 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 import os
 import json
+import hashlib
+import time
 import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from langchain.tools import BaseTool
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage
 from pydantic import Field
 from tqdm import tqdm
 
 from utils.call_llms import get_llm
-from configs.log_config import configure_logging
 from utils.prompts import PAPER_SUMMARY_PROMPT_CH, PAPER_SUMMARY_PROMPT_EN
 from utils.paper_process import download_pdf, delete_pdf, parse_pdf
 from utils.helper_func import make_response, save_md_file, safe_filename, load_jsonl
 
+# Attempts per summary when the LLM reports a transient failure (rate limit, unavailable service)
+SUMMARY_LLM_ATTEMPTS = 3
+SUMMARY_RETRY_BACKOFF_SECONDS = 2.0
+
+
+def unique_papers(papers: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Drop non-dict records and repeated papers, keeping the first record of each.
+    Papers are keyed by their PDF URL (falling back to the title), so the same paper
+    scraped twice with different metadata is downloaded and summarized only once.
+
+    Args:
+        papers: Paper records from a paper list
+
+    Returns:
+        Unique paper records, in input order
+    """
+    seen = set()
+    unique = []
+    for paper in papers:
+        if not isinstance(paper, dict):
+            continue
+        key = str(paper.get("paper_url", "")).strip() or str(paper.get("title", "")).strip().lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(paper)
+    return unique
+
 
 class PaperSummarizerTool(BaseTool):
     """Langchain tool for summarizing research papers"""
@@ -31,6 +62,7 @@ class PaperSummarizerTool(BaseTool):
                              description="Temporary directory for PDF downloads")
     api: str = Field(default="gemini", description="API to use for LLM calls")
     model_name: str = Field(default="gemini-2.5-flash", description="Model name for LLM calls")
+    batch_size: int = Field(default=8, description="Number of papers whose LLM calls run concurrently")
     
     def _run(self, conference: str, year: int, topic: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -48,17 +80,7 @@ class PaperSummarizerTool(BaseTool):
         
         try:
             # Determine which paper list to load
-            conf_key = (conference or "").strip().lower()
-            if topic:
-                # Use filtered list for specific topic
-                topic_key = "".join(c if c.isalnum() or c in ("-", "_") else "_"
-                                  for c in (topic or "").strip().lower()).strip("_") or "topic"
-                raw_list_path = os.path.join(self.paper_list_root, f"{conf_key}_{year}", f"filtered_{topic_key}.jsonl")
-                summary_base = os.path.join(self.paper_summary_root, f"{conf_key}_{year}", topic_key)
-            else:
-                # Use full list
-                raw_list_path = os.path.join(self.paper_list_root, f"{conf_key}_{year}", "full_list.jsonl")
-                summary_base = os.path.join(self.paper_summary_root, f"{conf_key}_{year}")
+            raw_list_path, summary_base = self._resolve_paths(conference, year, topic)
             
             # Load paper list
             if not os.path.isfile(raw_list_path):
@@ -76,33 +98,23 @@ class PaperSummarizerTool(BaseTool):
                     "papers_processed": 0
                 }
             
-            # Process each paper
-            results = []
-            for paper in tqdm(papers, desc=f"Summarizing papers for {conference} {year}"):
-                if not isinstance(paper, dict):
-                    continue
-                    
-                result = self._summarize_paper(
-                    paper,
-                    topic,
-                    self.scope_list_path,
-                    summary_base,
-                    self.temp_pdf_root,
-                    self.api,
-                    self.model_name
-                )
-                results.append(result)
-            
-            # Count successes and failures
-            successful = sum(1 for r in results if r.get("status") == "success")
-            failed = len(results) - successful
+            # Process the papers in batches, each distinct paper once
+            papers = unique_papers(papers)
+            # Count successes and failures as each batch finishes rather than keeping every result
+            batch_size = max(1, self.batch_size)
+            processed = successful = 0
+            for start in tqdm(range(0, len(papers), batch_size), desc=f"Summarizing papers for {conference} {year}"):
+                for result in self._summarize_batch(papers[start:start + batch_size], conference, year, topic):
+                    processed += 1
+                    successful += result.get("status") == "success"
+            failed = processed - successful
             
             return {
                 "status": "success",
-                "papers_processed": len(results),
+                "papers_processed": processed,
                 "successful_summaries": successful,
                 "failed_summaries": failed,
-                "message": f"Processed {len(results)} papers, {successful} successful, {failed} failed"
+                "message": f"Processed {processed} papers, {successful} successful, {failed} failed"
             }
             
         except Exception as e:
@@ -113,6 +125,75 @@ class PaperSummarizerTool(BaseTool):
                 "papers_processed": 0
             }
     
+    def _resolve_paths(self, conference: str, year: int, topic: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Resolve the paper list to read and the summary directory to write for a conference and year.
+
+        Args:
+            conference: Conference name
+            year: Conference year
+            topic: Research topic (optional); uses the filtered list when given, the full list otherwise
+
+        Returns:
+            Tuple of (paper list path, summary base directory)
+        """
+        conf_key = (conference or "").strip().lower()
+        if topic:
+            # Use filtered list for specific topic
+            topic_key = "".join(c if c.isalnum() or c in ("-", "_") else "_"
+                              for c in (topic or "").strip().lower()).strip("_") or "topic"
+            raw_list_path = os.path.join(self.paper_list_root, f"{conf_key}_{year}", f"filtered_{topic_key}.jsonl")
+            summary_base = os.path.join(self.paper_summary_root, f"{conf_key}_{year}", topic_key)
+        else:
+            # Use full list
+            raw_list_path = os.path.join(self.paper_list_root, f"{conf_key}_{year}", "full_list.jsonl")
+            summary_base = os.path.join(self.paper_summary_root, f"{conf_key}_{year}")
+        return raw_list_path, summary_base
+
+    def _summarize_one(self, paper: Dict[str, Any], conference: str, year: int,
+                       topic: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Summarize a single paper of a conference and year.
+
+        Args:
+            paper: Paper record from the paper list
+            conference: Conference name
+            year: Conference year
+            topic: Research topic (optional)
+
+        Returns:
+            Dictionary with the summarization result for this paper
+        """
+        _, summary_base = self._resolve_paths(conference, year, topic)
+        return self._summarize_paper(
+            paper,
+            topic,
+            self.scope_list_path,
+            summary_base,
+            self.temp_pdf_root,
+            self.api,
+            self.model_name
+        )
+    
+    def _summarize_batch(self, papers: List[Dict[str, Any]], conference: str, year: int,
+                         topic: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize a batch of papers, running their downloads and LLM calls concurrently.
+
+        Args:
+            papers: Paper records from the paper list
+            conference: Conference name
+            year: Conference year
+            topic: Research topic (optional)
+
+        Returns:
+            List with the summarization result of each paper, in input order
+        """
+        if not papers:
+            return []
+        with ThreadPoolExecutor(max_workers=len(papers)) as executor:
+            return list(executor.map(lambda paper: self._summarize_one(paper, conference, year, topic), papers))
+    
     def _summarize_paper(self, paper: Dict[str, Any], topic: Optional[str], scope_list_path: str,
                         paper_summary_root: str, temp_pdf_root: str, api: str, model_name: str) -> Dict[str, Any]:
         """Implement paper summarization directly"""
@@ -143,30 +224,7 @@ class PaperSummarizerTool(BaseTool):
                     keywords_list = scope.get(topic, [])
                     keywords = ", ".join(keywords_list) if keywords_list else ""
             
-            # Download and parse PDF
             safe_name = safe_filename(title)
-            pdf_path = os.path.join(temp_pdf_root, f"{safe_name}.pdf")
-            Path(temp_pdf_root).mkdir(parents=True, exist_ok=True)
-            
-            # Download PDF
-            download_result = download_pdf(url, pdf_path)
-            if download_result.get("status") != "success":
-                return {
-                    "status": "error",
-                    "error": f"Failed to download PDF: {download_result.get('message')}",
-                    "summaries_generated": 0
-                }
-            
-            # Parse PDF
-            parse_result = parse_pdf(pdf_path)
-            if parse_result.get("status") != "success":
-                return {
-                    "status": "error",
-                    "error": f"Failed to parse PDF: {parse_result.get('message')}",
-                    "summaries_generated": 0
-                }
-            
-            paper_content = parse_result.get("data", "")
             
             # Language prompts
             lang_prompts = {
@@ -174,7 +232,6 @@ class PaperSummarizerTool(BaseTool):
                 "CH": PAPER_SUMMARY_PROMPT_CH
             }
             
-            summaries = {}
             summary_paths = {}
             
             # Create summary directory structure
@@ -184,42 +241,63 @@ class PaperSummarizerTool(BaseTool):
                 lang_dir.mkdir(parents=True, exist_ok=True)
                 summary_paths[lang] = lang_dir / f"{safe_name}.md"
             
-            # Generate summaries for each language
-            for lang, prompt_template in lang_prompts.items():
-                if summary_paths[lang].exists():
-                    logging.info(f"[SUMMARIZER] {lang} summary already exists for '{title}', skipping")
+            missing = [lang for lang in lang_prompts if not summary_paths[lang].exists()]
+            for lang in lang_prompts:
+                if lang in missing:
                     continue
-                
-                try:
-                    # Format prompt
-                    prompt = prompt_template.format(
-                        text=paper_content,
-                        title=title,
-                        keywords=keywords
-                    )
-                    
-                    # Call LLM function
-                    resp_msg = llm_func(prompt)
-                    if resp_msg.get("status") != "success":
-                        logging.warning(f"[SUMMARIZER] Failed to generate {lang} summary for '{title}': {resp_msg.get('message')}")
-                        continue
-                    
-                    summary_text = resp_msg.get("data", "")
-                    
-                    if not summary_text or not summary_text.strip():
-                        logging.warning(f"[SUMMARIZER] Empty {lang} summary for '{title}'")
-                        continue
-                    
-                    # Save summary with debug logging
-                    save_result = save_md_file(summary_text, str(summary_paths[lang]))
-                    if save_result.get("status") == "success":
-                        summaries[lang] = summary_text
-                        logging.info(f"[SUMMARIZER] Saved {lang} summary for '{title}' to {summary_paths[lang]}")
-                    else:
-                        logging.error(f"[SUMMARIZER] Failed to save {lang} summary for '{title}': {save_result.get('message')}")
-                    
-                except Exception as e:
-                    logging.exception(f"[SUMMARIZER] Failed to generate {lang} summary for '{title}': {e}")
+                logging.info(f"[SUMMARIZER] {lang} summary already exists for '{title}', skipping")
+            
+            # Every summary is already on disk, so the PDF is neither downloaded nor parsed
+            if not missing:
+                return {
+                    "status": "success",
+                    "summaries_generated": 0,
+                    "languages": [],
+                    "summary_paths": {lang: str(path) for lang, path in summary_paths.items()},
+                    "message": f"All summaries already exist for '{title}'"
+                }
+            
+            # Download and parse PDF; the temp file is keyed by a hash of its URL, sharded by its first byte
+            pdf_key = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+            pdf_dir = Path(temp_pdf_root) / pdf_key[:2]
+            pdf_path = str(pdf_dir / f"{pdf_key}.pdf")
+            pdf_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Download PDF
+            download_result = download_pdf(url, pdf_path)
+            if download_result.get("status") != "success":
+                return self._paper_result(title, summary_paths, missing, {},
+                                          f"Failed to download PDF: {download_result.get('message')}")
+            
+            # Parse PDF
+            parse_result = parse_pdf(pdf_path)
+            if parse_result.get("status") != "success":
+                return self._paper_result(title, summary_paths, missing, {},
+                                          f"Failed to parse PDF: {parse_result.get('message')}")
+            
+            paper_content = parse_result.get("data", "")
+            
+            # Generate the missing summaries, one LLM call per language running concurrently
+            pending = {
+                lang: lang_prompts[lang].format(
+                    text=paper_content,
+                    title=title,
+                    keywords=keywords
+                )
+                for lang in missing
+            }
+            
+            summaries = {}
+            if pending:
+                with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                    futures = {
+                        lang: executor.submit(self._generate_summary, llm_func, lang, prompt, title, summary_paths[lang])
+                        for lang, prompt in pending.items()
+                    }
+                    for lang, future in futures.items():
+                        summary_text = future.result()
+                        if summary_text:
+                            summaries[lang] = summary_text
             
             # Clean up temporary PDF
             try:
@@ -227,13 +305,7 @@ class PaperSummarizerTool(BaseTool):
             except Exception:
                 pass
             
-            return {
-                "status": "success",
-                "summaries_generated": len(summaries),
-                "languages": list(summaries.keys()),
-                "summary_paths": {lang: str(path) for lang, path in summary_paths.items()},
-                "message": f"Successfully generated {len(summaries)} summaries for '{title}'"
-            }
+            return self._paper_result(title, summary_paths, missing, summaries, "Summary generation failed")
             
         except Exception as e:
             logging.exception(f"[SUMMARIZER] Failed to summarize paper '{title}': {e}")
@@ -243,9 +315,100 @@ class PaperSummarizerTool(BaseTool):
                 "summaries_generated": 0
             }
 
+    @staticmethod
+    def _paper_result(title: str, summary_paths: Dict[str, Path], missing: List[str],
+                      summaries: Dict[str, str], error: str) -> Dict[str, Any]:
+        """
+        Build the result of a paper once its missing summaries were generated, or failed to be.
+        The paper only counts as failed when it is left without any summary; languages that
+        are still missing are reported in missing_languages.
+
+        Args:
+            title: Paper title
+            summary_paths: Summary file path per language
+            missing: Languages whose summary was not on disk before this run
+            summaries: Summaries generated in this run, by language
+            error: Why the languages still missing could not be generated
+
+        Returns:
+            Summarization result dictionary
+        """
+        still_missing = [lang for lang in missing if lang not in summaries]
+        if len(still_missing) == len(summary_paths):
+            return {
+                "status": "error",
+                "error": f"No summaries generated for '{title}' (missing: {', '.join(still_missing)}): {error}",
+                "summaries_generated": 0,
+                "missing_languages": still_missing
+            }
+        
+        result = {
+            "status": "success",
+            "summaries_generated": len(summaries),
+            "languages": list(summaries.keys()),
+            "summary_paths": {lang: str(path) for lang, path in summary_paths.items() if lang not in still_missing},
+            "message": f"Successfully generated {len(summaries)} summaries for '{title}'"
+        }
+        if still_missing:
+            logging.warning(f"[SUMMARIZER] {', '.join(still_missing)} summary missing for '{title}': {error}")
+            result["missing_languages"] = still_missing
+        return result
+
+    @staticmethod
+    def _generate_summary(llm_func, lang: str, prompt: str, title: str, summary_path: Path) -> Optional[str]:
+        """
+        Generate one language's summary of a paper and save it as markdown.
+
+        Args:
+            llm_func: LLM function returned by get_llm
+            lang: Summary language ('EN' or 'CH')
+            prompt: Fully formatted summary prompt
+            title: Paper title (for logging)
+            summary_path: Markdown file to write
+
+        Returns:
+            The summary text if it was generated and saved, None otherwise
+        """
+        try:
+            # Call LLM function, backing off exponentially while it is rate limited or unavailable
+            for attempt in range(SUMMARY_LLM_ATTEMPTS):
+                resp_msg = llm_func(prompt)
+                if resp_msg.get("status") == "success" or not resp_msg.get("transient"):
+                    break
+                if attempt + 1 < SUMMARY_LLM_ATTEMPTS:
+                    delay = SUMMARY_RETRY_BACKOFF_SECONDS * 2 ** attempt
+                    logging.warning(f"[SUMMARIZER] Transient failure for {lang} summary of '{title}'; retrying in {delay:.0f}s")
+                    time.sleep(delay)
+            if resp_msg.get("status") != "success":
+                logging.warning(f"[SUMMARIZER] Failed to generate {lang} summary for '{title}': {resp_msg.get('message')}")
+                return None
+            
+            summary_text = resp_msg.get("data", "")
+            
+            if not summary_text or not summary_text.strip():
+                logging.warning(f"[SUMMARIZER] Empty {lang} summary for '{title}'")
+                return None
+            
+            # Save summary with debug logging
+            save_result = save_md_file(summary_text, str(summary_path))
+            if save_result.get("status") == "success":
+                logging.info(f"[SUMMARIZER] Saved {lang} summary for '{title}' to {summary_path}")
+                return summary_text
+            logging.error(f"[SUMMARIZER] Failed to save {lang} summary for '{title}': {save_result.get('message')}")
+            return None
+            
+        except Exception as e:
+            logging.exception(f"[SUMMARIZER] Failed to generate {lang} summary for '{title}': {e}")
+            return None
+
     async def _arun(self, conference: str, year: int, topic: Optional[str] = None) -> Dict[str, Any]:
-        """Async version of the tool"""
-        return self._run(conference, year, topic)
+        """Async version of the tool; runs the blocking implementation in a worker thread"""
+        return await asyncio.to_thread(self._run, conference, year, topic)
+
+    async def _asummarize_batch(self, papers: List[Dict[str, Any]], conference: str, year: int,
+                                topic: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Async version of _summarize_batch; runs in a worker thread"""
+        return await asyncio.to_thread(self._summarize_batch, papers, conference, year, topic)
 
 
 # Export the tools for easy access
@@ -1,16 +1,59 @@
 from typing import Any, Dict, List, Optional
 import os
-import pandas as pd
+from importlib.util import find_spec
 from tqdm import tqdm
 from pathlib import Path
 import logging
+import asyncio
 from langchain.tools import BaseTool
 from langchain_core.tools import tool
 from pydantic import Field
 
-from configs.log_config import configure_logging
 from utils.helper_func import make_response, load_md_file, parse_markdown_summary, load_jsonl, safe_filename
 
+# Languages that summaries are generated and aggregated in
+SUMMARY_LANGUAGES = ("CH", "EN")
+# Columns of the aggregated Excel report, in order
+SUMMARY_COLUMNS = ("Title", "Authors", "Affiliations", "Keywords", "Highlights")
+# Stream reports row by row with xlsxwriter when it is installed; pandas/openpyxl otherwise
+EXCEL_STREAMING = find_spec("xlsxwriter") is not None
+
+
+def _write_excel_report(excel_path: str, columns: Dict[str, List[Any]]) -> None:
+    """
+    Write aggregated summary columns to an Excel report.
+
+    With xlsxwriter, rows are written in constant_memory mode, so each row is flushed to disk
+    as soon as the next one starts and the workbook is never held in memory. Without it, the
+    report is built as a DataFrame and written through pandas.
+
+    Args:
+        excel_path: Path of the .xlsx file to write
+        columns: Aggregated values keyed by column name, in SUMMARY_COLUMNS order
+    """
+    # List cells (authors, keywords, ...) are joined here, so both writers produce the same cells
+    columns = {
+        column: [", ".join(map(str, v)) if isinstance(v, list) else v for v in columns[column]]
+        for column in SUMMARY_COLUMNS
+    }
+    
+    if not EXCEL_STREAMING:
+        import pandas as pd  # deferred: only needed when a report is written
+        pd.DataFrame(columns, columns=list(SUMMARY_COLUMNS)).to_excel(excel_path, index=False)
+        return
+
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(excel_path, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet()
+        bold = workbook.add_format({"bold": True})
+        worksheet.write_row(0, 0, SUMMARY_COLUMNS, bold)
+        for row, values in enumerate(zip(*(columns[column] for column in SUMMARY_COLUMNS)), start=1):
+            worksheet.write_row(row, 0, values)
+    finally:
+        workbook.close()
+
 
 def _aggregate_summaries_impl(
     conference: str,
@@ -76,8 +119,9 @@ def _aggregate_summaries_impl(
                 "aggregated_count": 0
             }
         
-        # Aggregate summaries
-        aggregated_summary = []
+        # Aggregate summaries column-wise, so the DataFrame is built straight from the columns
+        aggregated_summary: Dict[str, List[Any]] = {column: [] for column in SUMMARY_COLUMNS}
+        aggregated_count = 0
         failed_count = 0
         
         for paper in tqdm(papers, desc=f"Aggregating {language} summaries"):
@@ -121,28 +165,26 @@ def _aggregate_summaries_impl(
             keywords = parsed_content.get("Brief Summary", {}).get("Keywords", [])
             highlights = parsed_content.get("Brief Summary", {}).get("Highlight", "")
             
-            aggregated_summary.append({
-                "Title": title,
-                "Authors": authors,
-                "Affiliations": affiliations,
-                "Keywords": keywords,
-                "Highlights": highlights
-            })
+            aggregated_summary["Title"].append(title)
+            aggregated_summary["Authors"].append(authors)
+            aggregated_summary["Affiliations"].append(affiliations)
+            aggregated_summary["Keywords"].append(keywords)
+            aggregated_summary["Highlights"].append(highlights)
+            aggregated_count += 1
         
         # Save to Excel
-        if aggregated_summary:
+        if aggregated_count:
             excel_path = os.path.join(paper_summary_path, "summary.xlsx")
-            summary_df = pd.DataFrame.from_records(aggregated_summary)
-            summary_df.to_excel(excel_path, index=False)
+            _write_excel_report(excel_path, aggregated_summary)
             
             logging.info(f"[SUMMARY_AGGREGATOR] Saved aggregated summary to {excel_path}")
             
             return {
                 "status": "success",
-                "aggregated_count": len(aggregated_summary),
+                "aggregated_count": aggregated_count,
                 "failed_count": failed_count,
                 "excel_path": excel_path,
-                "message": f"Aggregated {len(aggregated_summary)} {language} summaries, {failed_count} failures"
+                "message": f"Aggregated {aggregated_count} {language} summaries, {failed_count} failures"
             }
         else:
             return {
@@ -282,51 +324,84 @@ class SummaryAggregatorTool(BaseTool):
         Returns:
             Dictionary with aggregation results for both languages (without redundant fields)
         """
-        results = {}
-        
         # Aggregate both Chinese and English summaries
-        for language in ["CH", "EN"]:
-            try:
-                result = _aggregate_summaries_impl(
-                    conference,
-                    year,
-                    topic,
-                    language,
-                    self.paper_list_root,
-                    self.paper_summary_root
-                )
-                # Extract only the necessary fields to avoid state conflicts
-                results[language] = {
-                    "status": result.get("status"),
-                    "aggregated_count": result.get("aggregated_count", 0),
-                    "failed_count": result.get("failed_count", 0),
-                    "excel_path": result.get("excel_path", ""),
-                    "message": result.get("message", "")
-                }
-                if result.get("status") == "error":
-                    results[language]["error"] = result.get("error", "Unknown error")
-            except Exception as e:
-                logging.warning(f"[SUMMARY_AGGREGATOR] Failed to aggregate {language} summaries: {e}")
-                results[language] = {
-                    "status": "error",
-                    "error": str(e),
-                    "aggregated_count": 0,
-                    "failed_count": 0,
-                    "excel_path": ""
-                }
-        
+        results = {
+            language: self._aggregate_language(conference, year, topic, language)
+            for language in SUMMARY_LANGUAGES
+        }
+        return self._combine_language_results(results)
+    
+    def _aggregate_language(self, conference: str, year: int, topic: Optional[str], language: str) -> Dict[str, Any]:
+        """
+        Aggregate the summaries of a single language.
+
+        Args:
+            conference: Conference name
+            year: Conference year
+            topic: Research topic (optional)
+            language: Language of summaries ('CH' or 'EN')
+
+        Returns:
+            Dictionary with the aggregation result for this language
+        """
+        try:
+            result = _aggregate_summaries_impl(
+                conference,
+                year,
+                topic,
+                language,
+                self.paper_list_root,
+                self.paper_summary_root
+            )
+            # Extract only the necessary fields to avoid state conflicts
+            lang_result = {
+                "status": result.get("status"),
+                "aggregated_count": result.get("aggregated_count", 0),
+                "failed_count": result.get("failed_count", 0),
+                "excel_path": result.get("excel_path", ""),
+                "message": result.get("message", "")
+            }
+            if result.get("status") == "error":
+                lang_result["error"] = result.get("error", "Unknown error")
+            return lang_result
+        except Exception as e:
+            logging.warning(f"[SUMMARY_AGGREGATOR] Failed to aggregate {language} summaries: {e}")
+            return {
+                "status": "error",
+                "error": str(e),
+                "aggregated_count": 0,
+                "failed_count": 0,
+                "excel_path": ""
+            }
+    
+    @staticmethod
+    def _combine_language_results(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine per-language aggregation results into the tool's overall result.
+
+        Args:
+            results: Aggregation results keyed by language
+
+        Returns:
+            Dictionary with aggregation results for all languages (without redundant fields)
+        """
         # Return combined results without redundant fields that conflict with state
         overall_status = "success" if any(r.get("status") == "success" for r in results.values()) else "error"
+        counts = ", ".join(f"{lang} ({results.get(lang, {}).get('aggregated_count', 0)})" for lang in SUMMARY_LANGUAGES)
         
         return {
             "status": overall_status,
             "language_results": results,
-            "message": f"Aggregated summaries for both languages: CH ({results['CH'].get('aggregated_count', 0)}), EN ({results['EN'].get('aggregated_count', 0)})"
+            "message": f"Aggregated summaries for both languages: {counts}"
         }
     
-    async def _arun(self, conference: str, year: int, topic: Optional[str] = None, language: str = "CH") -> Dict[str, Any]:
-        """Async version of the tool"""
-        return self._run(conference, year, topic, language)
+    async def _arun(self, conference: str, year: int, topic: Optional[str] = None) -> Dict[str, Any]:
+        """Async version of the tool; runs the blocking implementation in a worker thread"""
+        return await asyncio.to_thread(self._run, conference, year, topic)
+
+    async def _aaggregate_language(self, conference: str, year: int, topic: Optional[str], language: str) -> Dict[str, Any]:
+        """Async version of _aggregate_language; runs in a worker thread"""
+        return await asyncio.to_thread(self._aggregate_language, conference, year, topic, language)
 
 
 # Export the tools for easy access
@@ -5,6 +5,8 @@ Adapted for langchain framework compatibility with English comments.
 
 from .helper_func import (
     make_response,
+    TransientError,
+    is_transient_error,
     ensure_parent_dir,
     ensure_list,
     merge_unique_elements,
@@ -15,22 +17,11 @@ from .helper_func import (
     load_jsonl,
     save_jsonl,
     update_jsonl,
+    loads_json,
+    save_json,
+    file_lock,
     parse_markdown_summary
 )
-from .call_llms import get_llm
-from .paper_process import (
-    paper_matches_topic,
-    download_pdf,
-    parse_pdf,
-    delete_pdf,
-    fetch_papers,
-    fetch_neurips_papers,
-    fetch_popets_papers,
-    fetch_usenix_security_papers,
-    fetch_usenix_soups_papers,
-    fetch_acl_long_papers,
-    fetch_acl_findings_papers
-)
 from .prompts import (
     KEYWORDS_GENERATION_PROMPT,
     PAPER_FILTER_PROMPT,
@@ -43,6 +34,8 @@ from .prompts import (
 __all__ = [
     # Helper functions
     'make_response',
+    'TransientError',
+    'is_transient_error',
     'ensure_parent_dir',
     'ensure_list',
     'merge_unique_elements',
@@ -53,10 +46,14 @@ __all__ = [
     'load_jsonl',
     'save_jsonl',
     'update_jsonl',
+    'loads_json',
+    'save_json',
+    'file_lock',
     'parse_markdown_summary',
     
     # LLM functions
     'get_llm',
+    'invalidate_llm_cache',
     
     # Paper processing functions
     'paper_matches_topic',
@@ -78,4 +75,32 @@ __all__ = [
     'RESEARCH_TREND_PROMPT',
     'PAPER_SUMMARY_PROMPT_CH',
     'PAPER_SUMMARY_PROMPT_EN'
-]
\ No newline at end of file
+]
+
+# LLM clients and PDF/HTML parsers are heavy to import, so these submodules are only
+# loaded on first attribute access (e.g. `from utils import get_llm`)
+_LAZY_EXPORTS = {
+    'get_llm': 'call_llms',
+    'invalidate_llm_cache': 'call_llms',
+    'paper_matches_topic': 'paper_process',
+    'download_pdf': 'paper_process',
+    'parse_pdf': 'paper_process',
+    'delete_pdf': 'paper_process',
+    'fetch_papers': 'paper_process',
+    'fetch_neurips_papers': 'paper_process',
+    'fetch_popets_papers': 'paper_process',
+    'fetch_usenix_security_papers': 'paper_process',
+    'fetch_usenix_soups_papers': 'paper_process',
+    'fetch_acl_long_papers': 'paper_process',
+    'fetch_acl_findings_papers': 'paper_process',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -3,27 +3,117 @@ Helper functions for Research Trend Analyzer Agent.
 Adapted for langchain framework compatibility with English comments.
 """
 
-from typing import Dict, Any, List, Optional, Literal, Generator, Union
+from typing import Dict, Any, List, Optional, Literal, Generator, Tuple, Union
 import re
 import os
+import tempfile
+import threading
 from pathlib import Path
 import json
 import logging
+from functools import lru_cache
+from importlib.util import find_spec
+
+# Write buffer for JSONL files, so a whole paper list goes out in a few large writes
+JSONL_WRITE_BUFFER = 1 << 20
+_jsonl_encoder = json.JSONEncoder(ensure_ascii=False)
+_jsonl_canon_encoder = json.JSONEncoder(ensure_ascii=False, sort_keys=True)
+
+# Per-file locks serializing read-modify-write updates from concurrent workflow runs
+_file_locks: Dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+# JSON is encoded and decoded with orjson when it is installed; stdlib json otherwise
+if find_spec("orjson") is not None:
+    import orjson
+
+    def loads_json(s: Union[str, bytes]) -> Any:
+        """Decode a JSON document; raises ValueError if it is malformed."""
+        return orjson.loads(s)
+
+    def _dumps_row(obj: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    def _dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+else:
+    def loads_json(s: Union[str, bytes]) -> Any:
+        """Decode a JSON document; raises ValueError if it is malformed."""
+        return json.loads(s)
+
+    def _dumps_row(obj: Any, sort_keys: bool = False) -> str:
+        return (_jsonl_canon_encoder if sort_keys else _jsonl_encoder).encode(obj)
+
+    def _dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Patterns for strip_code_block and parse_markdown_summary, compiled once
+CODE_BLOCK_PAT = re.compile(r"^```(?:json|python)?\s*([\s\S]+?)\s*```$", re.IGNORECASE)
+MD_CODE_BLOCKS_PAT = re.compile(r"```(?:\w+)?\n(.*?)\n```", re.S)
+MD_H1_PAT = re.compile(r"^#\s+(.+?)\s*$")
+MD_H2_PAT = re.compile(r"^##\s+(.+?)\s*$")
+MD_H3_PAT = re.compile(r"^###\s+(.+?)\s*$")
+MD_CONTENT_REF_PAT = re.compile(r":contentReference\[.*?\]\{.*?\}")
+MD_LINK_PAT = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+CJK_PUNCT, OPENERS = "，。；：！？、）】》％%", "（【《\"'([{"
+SPACE_BEFORE_CJK_PUNCT_PAT = re.compile(r"\s+([{}])".format(CJK_PUNCT))
+SPACE_BEFORE_CLOSER_PAT = re.compile(r"\s+([)\]】》}])")
+INLINE_WS_PAT = re.compile(r"[ \t]+")
+
+# HTTP status codes of failures worth retrying: request timeout, rate limit, server errors
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class TransientError(RuntimeError):
+    """A failure worth retrying: a timeout, a rate limit or an unavailable service."""
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Tell whether an exception is a transient failure, by its type or HTTP status code
+    (never by its message, which may quote titles, URLs or host names).
+    
+    Args:
+        exc: Exception raised by an HTTP or LLM call
+        
+    Returns:
+        True for TransientError, timeouts and errors carrying a TRANSIENT_STATUS_CODES status
+    """
+    if isinstance(exc, (TransientError, TimeoutError)):
+        return True
+    try:
+        from requests.exceptions import Timeout
+        if isinstance(exc, Timeout):
+            return True
+    except ImportError:
+        pass
+    # google-genai APIError carries the status as .code, requests HTTPError on its response
+    status = getattr(exc, "code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status, int) and status in TRANSIENT_STATUS_CODES
+
 
 def make_response(
     status: Literal["success", "warning", "error"],
     message: str,
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None,
+    transient: bool = False
 ) -> Dict[str, Any]:
     """
     Construct structured return message:
     {
         "status": "success" | "warning" | "error",
         "message": "description message",
-        "data": {...} | None
+        "data": {...} | None,
+        "transient": True   # only on errors worth retrying
     }
     """
-    return {"status": status, "message": message, "data": data}
+    response = {"status": status, "message": message, "data": data}
+    if transient:
+        response["transient"] = True
+    return response
 
 def ensure_parent_dir(db_path):
     """Ensure parent directory exists for the given file path."""
@@ -53,14 +143,16 @@ def merge_unique_elements(list1, list2):
 
 def strip_code_block(text: str) -> str:
     """Remove code block markers (```json, ```python, etc.) from text."""
-    code_block_pattern = r"^```(?:json|python)?\s*([\s\S]+?)\s*```$"
-    match = re.match(code_block_pattern, text.strip(), re.IGNORECASE)
+    match = CODE_BLOCK_PAT.match(text.strip())
     if match:
         return match.group(1).strip()
     return text.strip()
 
+@lru_cache(maxsize=4096)
 def safe_filename(name: str, max_length: int = 100) -> str:
     """Convert a string to a safe filename by removing invalid characters.
+    The result is memoized, since every paper title is converted once per language
+    by both the summarizer and the aggregator.
     
     Args:
         name: The original string to convert
@@ -145,6 +237,61 @@ def load_md_file(md_path: str) -> Dict[str, Any]:
             None
         )
     
+def file_lock(path: Union[str, Path]) -> threading.Lock:
+    """
+    Get the process-wide lock guarding read-modify-write updates of a file.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        The same lock for every path that resolves to the same file
+    """
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        return _file_locks.setdefault(key, threading.Lock())
+
+
+def _replace_file(path: Path, content: bytes) -> None:
+    """
+    Atomically replace a file's content.
+    The content is written to a uniquely named temporary file in the same directory,
+    which then replaces the target, so concurrent writers never share a temporary file.
+    
+    Args:
+        path: Path to the file
+        content: New file content
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(content)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a JSON file with 2-space indentation, atomically,
+    so a crash mid-write never leaves a truncated file behind.
+    Callers that read, modify and write back a file should hold file_lock(path).
+    
+    Args:
+        path: Path to the .json file
+        data: JSON-serializable data
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _replace_file(path, _dumps_indented(data))
+
+
 def load_jsonl(
     path: Union[str, Path],
     return_generator: bool = False
@@ -171,7 +318,7 @@ def load_jsonl(
                 if not s:
                     continue
                 try:
-                    obj = json.loads(s)
+                    obj = loads_json(s)
                     if isinstance(obj, dict):
                         yield obj
                     else:
@@ -201,12 +348,13 @@ def save_jsonl(path: Union[str, Path], rows: List[Dict[str, Any]], append: bool
     written = 0
 
     try:
-        with path.open(mode, encoding="utf-8") as f:
+        with path.open(mode, encoding="utf-8", buffering=JSONL_WRITE_BUFFER) as f:
             for row in rows:
                 if not isinstance(row, dict):
                     logging.warning("[JSONL] Skipping non-dict row.")
                     continue
-                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                f.write(_dumps_row(row))
+                f.write("\n")
                 written += 1
         logging.info(f"[JSONL] Wrote {written} rows to {path} (append={append})")
         return written
@@ -215,12 +363,61 @@ def save_jsonl(path: Union[str, Path], rows: List[Dict[str, Any]], append: bool
         return 0
 
     
+def _read_jsonl_rows(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read every dict row of a JSONL file, counting the lines that had to be skipped.
+    
+    Args:
+        path: Path to the .jsonl file
+        
+    Returns:
+        Tuple of (dict rows, number of malformed or non-dict lines)
+    """
+    rows: List[Dict[str, Any]] = []
+    skipped = 0
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if not s:
+                continue
+            try:
+                obj = loads_json(s)
+            except ValueError:
+                obj = None
+            if isinstance(obj, dict):
+                rows.append(obj)
+            else:
+                skipped += 1
+    return rows, skipped
+
+
+def _lacks_trailing_newline(path: Path) -> bool:
+    """
+    Check whether a non-empty file is missing the newline after its last line.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        True if the file is non-empty and its last byte is not a newline
+    """
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
 def update_jsonl(path: Union[str, Path], rows: List[Dict[str, Any]]) -> int:
     """
     Update a JSONL file with new rows:
       - If the file exists: load, dedupe by full row content, then add new rows
       - If not: create with the given rows
-      - Saves result back to the same path (overwrite)
+      - Only the new rows are written, appended to the end of the file; a file with
+        malformed lines or without a trailing newline is instead rewritten in full
+      - If the file cannot be read, it is left untouched and nothing is added
+      - Concurrent updates of the same file are serialized by file_lock(path)
       
     Args:
         path: Path to the .jsonl file
@@ -237,37 +434,49 @@ def update_jsonl(path: Union[str, Path], rows: List[Dict[str, Any]]) -> int:
         logging.info(f"[JSONL] No valid rows to add to {path}")
         return 0
 
-    # Load existing rows (if any)
-    existing: List[Dict[str, Any]] = []
-    if path.exists():
+    with file_lock(path):
+        # Load existing rows (if any); without them new rows cannot be deduplicated, so do not write blind
+        existing: List[Dict[str, Any]] = []
+        skipped = 0
+        unterminated = False
+        if path.exists():
+            try:
+                existing, skipped = _read_jsonl_rows(path)
+                unterminated = _lacks_trailing_newline(path)
+            except Exception as e:
+                logging.exception(f"[JSONL] Failed to read {path}; leaving it untouched: {e}")
+                return 0
+
+        # Deduplicate using canonical JSON strings
+        canon = lambda obj: _dumps_row(obj, sort_keys=True)
+        seen = {canon(r) for r in existing}
+
+        new_rows: List[Dict[str, Any]] = []
+        for r in candidates:
+            c = canon(r)
+            if c not in seen:
+                new_rows.append(r)
+                seen.add(c)
+
+        if not new_rows and not skipped and not unterminated:
+            logging.info(f"[JSONL] No new rows to add for {path} (all duplicates).")
+            return 0
+
         try:
-            existing = load_jsonl(path)  # list mode
+            if skipped or unterminated:
+                # Appending would glue the first new row onto an unterminated last line, so rewrite the
+                # file (without any malformed lines) and swap it in atomically
+                if skipped:
+                    logging.warning(f"[JSONL] Dropping {skipped} malformed lines from {path}")
+                _replace_file(path, "".join(_dumps_row(r) + "\n" for r in existing + new_rows).encode("utf-8"))
+                added = len(new_rows)
+            else:
+                added = save_jsonl(path, new_rows, append=True)  # existing rows are left untouched
+            logging.info(f"[JSONL] Updated {path} with {added} new rows (total {len(existing) + added})")
+            return added
         except Exception as e:
-            logging.exception(f"[JSONL] Failed to read {path}: {e}")
-
-    # Deduplicate using canonical JSON strings
-    canon = lambda obj: json.dumps(obj, sort_keys=True, ensure_ascii=False)
-    seen = {canon(r) for r in existing}
-
-    added = 0
-    for r in candidates:
-        c = canon(r)
-        if c not in seen:
-            existing.append(r)
-            seen.add(c)
-            added += 1
-
-    if added == 0:
-        logging.info(f"[JSONL] No new rows to add for {path} (all duplicates).")
-        return 0
-
-    try:
-        save_jsonl(path, existing, append=False)  # overwrite with deduped content
-        logging.info(f"[JSONL] Updated {path} with {added} new rows (total {len(existing)})")
-        return added
-    except Exception as e:
-        logging.exception(f"[JSONL] Failed to update {path}: {e}")
-        return 0
+            logging.exception(f"[JSONL] Failed to update {path}: {e}")
+            return 0
 
 
 def parse_markdown_summary(md_text: str) -> Dict:
@@ -312,16 +521,14 @@ def parse_markdown_summary(md_text: str) -> Dict:
         }
 
         # parse Paper info code block
-        code_blocks = re.findall(r"```(?:\w+)?\n(.*?)\n```", md_text, flags=re.S)
+        code_blocks = MD_CODE_BLOCKS_PAT.findall(md_text)
         md = next(
             (b for b in code_blocks if "# Paper Info" in b),
             code_blocks[0] if code_blocks else md_text,
         )
 
         # aggregate titles
-        h1 = re.compile(r"^#\s+(.+?)\s*$")
-        h2 = re.compile(r"^##\s+(.+?)\s*$")
-        h3 = re.compile(r"^###\s+(.+?)\s*$")
+        h1, h2, h3 = MD_H1_PAT, MD_H2_PAT, MD_H3_PAT
         TOP = {"Paper Info", "Brief Summary", "Detailed Summary"}
         PI = {"Title", "Authors", "Affiliations"}
         BS = {"Highlight", "Keywords"}
@@ -347,12 +554,10 @@ def parse_markdown_summary(md_text: str) -> Dict:
         }
 
         # clean and connect
-        CJK_PUNCT, OPENERS = "，。；：！？、）】》％%", "（【《\"'([{" 
-
         def clean(s: str) -> str:
             try:
-                s = re.sub(r":contentReference\[.*?\]\{.*?\}", "", s)
-                s = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1", s)
+                s = MD_CONTENT_REF_PAT.sub("", s)
+                s = MD_LINK_PAT.sub(r"\1", s)
                 return s.replace("`", "").strip()
             except re.error as e:
                 # If a regex engine error occurs, fall back to a minimal clean
@@ -368,9 +573,9 @@ def parse_markdown_summary(md_text: str) -> Dict:
             glue = "" if (first in CJK_PUNCT or last in OPENERS or (last == "-" and first.isalpha())) else " "
             out = a + glue + b
             try:
-                out = re.sub(r"\s+([{}])".format(CJK_PUNCT), r"\1", out)
-                out = re.sub(r"\s+([)\]】》}])", r"\1", out)
-                return re.sub(r"[ \t]+", " ", out).strip()
+                out = SPACE_BEFORE_CJK_PUNCT_PAT.sub(r"\1", out)
+                out = SPACE_BEFORE_CLOSER_PAT.sub(r"\1", out)
+                return INLINE_WS_PAT.sub(" ", out).strip()
             except re.error:
                 # If post-joins regex fails, return a simple whitespace-normalized string
                 return " ".join(out.split())
@@ -1,12 +1,16 @@
 # paper_crawler.py
 import os
 import requests
-import fitz
 import re
+from importlib.util import find_spec
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
-from typing import List, Dict, Any, Union, Optional, Iterable
+from typing import List, Dict, Any, Union, Optional, Iterable, Callable
 from utils.helper_func import *
 from tqdm import tqdm
 
@@ -20,6 +24,32 @@ HEADERS = {
     "Accept": "application/pdf,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Chunk size for streaming PDF downloads to disk
+PDF_CHUNK_SIZE = 64 * 1024
+
+
+def _build_session() -> requests.Session:
+    """Create an HTTP session with pooled keep-alive connections and retries on transient failures."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,  # hand the last response back so callers report the status code
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by all PDF downloads and page fetches, so connections to each site are reused
+SESSION = _build_session()
+
+# BeautifulSoup backend: lxml's C parser when installed, the pure-Python parser otherwise
+HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
 
 def paper_matches_topic(
     paper: Dict[str, Any],
@@ -45,12 +75,10 @@ def paper_matches_topic(
                 None
             )
 
-        # Combine text from specified fields into one lowercase string
-        combined_text = ""
-        for field in fields:
-            value = paper.get(field, "")
-            if isinstance(value, str):
-                combined_text += " " + value.lower()
+        # Combine text from specified fields into one lowercase string (lowered once, joined once)
+        combined_text = " " + " ".join(
+            value for value in (paper.get(field, "") for field in fields) if isinstance(value, str)
+        ).lower()
 
         if not combined_text.strip():
             # TODO: warning or error?
@@ -123,19 +151,32 @@ def download_pdf(pdf_url: str, paper_path: str):
     ensure_parent_dir(paper_path)
 
     try:
-        resp = requests.get(pdf_url, headers=HEADERS, allow_redirects=True, timeout=30)
-        resp.raise_for_status()
-        if not resp.content.startswith(b"%PDF"):
-            snippet = resp.content[:300].decode(errors="replace")
-            return make_response("error", 
-                                 f"Not a valid PDF (possible HTML page). Snippet: {snippet}",
-                                 None)
-        
-        with open(paper_path, "wb") as f:
-            f.write(resp.content)
+        # Stream the body to disk so memory stays bounded by PDF_CHUNK_SIZE
+        with SESSION.get(pdf_url, headers=HEADERS, allow_redirects=True, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            chunks = resp.iter_content(chunk_size=PDF_CHUNK_SIZE)
+            head = next(chunks, b"")
+            if not head.startswith(b"%PDF"):
+                snippet = head[:300].decode(errors="replace")
+                return make_response("error", 
+                                     f"Not a valid PDF (possible HTML page). Snippet: {snippet}",
+                                     None)
+
+            n_bytes = 0
+            try:
+                with open(paper_path, "wb") as f:
+                    for chunk in chain((head,), chunks):
+                        f.write(chunk)
+                        n_bytes += len(chunk)
+            except Exception:
+                # Do not leave a truncated PDF behind
+                if os.path.exists(paper_path):
+                    os.remove(paper_path)
+                raise
+
         return make_response("success", 
                              "Downloaded PDF successfully.",
-                              {"pdf_url": pdf_url, "path": paper_path, "bytes": len(resp.content)})
+                              {"pdf_url": pdf_url, "path": paper_path, "bytes": n_bytes})
     
     except requests.HTTPError as e:
         return make_response("error",
@@ -146,9 +187,13 @@ def download_pdf(pdf_url: str, paper_path: str):
         return make_response("error", f"Failed to download or save PDF: {e}", None)
 
 
-# Compile once
-ACK_PAT = re.compile(r"^\s*acknowledg(e)?ment(s)?\s*$", re.IGNORECASE)
-REF_PAT = re.compile(r"^\s*(references?|bibliography|works\s+cited)\s*$", re.IGNORECASE)
+# Compile once: a single multiline pattern finds the first stop heading of a page in one scan
+# (whitespace classes exclude newlines so a heading never spans two lines)
+STOP_SECTION_PAT = re.compile(
+    r"^[^\S\n]*(?:(?P<acknowledgments>acknowledg(?:e)?ment(?:s)?)"
+    r"|(?P<references>references?|bibliography|works[^\S\n]+cited))[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
 
 def validate_pdf_path(pdf_path: str) -> None:
     if not isinstance(pdf_path, str) or not pdf_path.strip():
@@ -180,6 +225,12 @@ def parse_pdf(
     except Exception as e:
         return make_response("error", str(e), None)
 
+    # PyMuPDF is only needed here, so it is imported on first use rather than with the crawlers
+    try:
+        import fitz
+    except Exception as e:
+        return make_response("error", f"Missing dependency 'pymupdf': {e}", None)
+
     try:
         with fitz.open(pdf_path) as doc:
             page_count = doc.page_count
@@ -205,24 +256,13 @@ def parse_pdf(
                 except Exception as e:
                     return make_response("error", f"Failed to read page {pno}: {e}", None)
 
-                lines = page_text.splitlines()
-
-                hit_idx = None
-                hit_label = None
-                for i, ln in enumerate(lines):
-                    if ACK_PAT.match(ln):
-                        hit_idx, hit_label = i, "acknowledgments"
-                        break
-                    if REF_PAT.match(ln):
-                        hit_idx, hit_label = i, "references"
-                        break
-
-                if hit_idx is None:
+                hit = STOP_SECTION_PAT.search(page_text)
+                if hit is None:
                     parts.append(page_text)
                     continue
 
                 # Found a stop section on this page
-                stop_section = hit_label
+                stop_section = hit.lastgroup
                 stop_page = pno
 
                 if include_anchor_page:
@@ -230,7 +270,7 @@ def parse_pdf(
                     parts.append(page_text)
                 else:
                     # EXCLUDE the heading and everything after it on this page
-                    before = "\n".join(lines[:hit_idx]).rstrip()
+                    before = page_text[:hit.start()].rstrip()
                     parts.append(before)
 
                 break  # stop after handling the anchor page
@@ -294,6 +334,11 @@ class BaseFetcher(ABC):
         ),
         "Accept": "application/pdf,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
+    # Max number of per-paper pages fetched from the site at the same time
+    MAX_WORKERS: int = 8
+    # Patterns used on every scraped entry, compiled once
+    WS_PAT = re.compile(r"\s+")
+    AUTHOR_SEP_PAT = re.compile(r",|\band\b", re.IGNORECASE)
 
     def fetch(self, year: int) -> Dict[str, Any]:
         """Public API: validate → scrape → wrap in make_response."""
@@ -304,7 +349,7 @@ class BaseFetcher(ABC):
                 return make_response("success", f"No papers found for {self.SITE} {y}.", [])
             return make_response("success", f"Fetched {len(data)} papers from {self.SITE} {y}.", data)
         except Exception as e:
-            return make_response("error", f"{self.SITE} error: {e}", None)
+            return make_response("error", f"{self.SITE} error: {e}", None, transient=is_transient_error(e))
 
     # -------- hooks for subclasses --------
     @abstractmethod
@@ -321,37 +366,46 @@ class BaseFetcher(ABC):
             raise ValueError(f"year out of expected range: {y}.")
         return y
 
-    def _fetch_html(self, url: str, headers: Dict[str, str], label: str, timeout: int = 30) -> str:
+    def _fetch_html(self, url: str, headers: Dict[str, str], label: str, timeout: int = 30) -> bytes:
         try:
             import requests
         except Exception as e:
             raise RuntimeError(f"Missing dependency 'requests': {e}")
         try:
-            resp = requests.get(url, headers=headers, allow_redirects=True, timeout=timeout)
+            resp = SESSION.get(url, headers=headers, allow_redirects=True, timeout=timeout)
         except requests.RequestException as e:
-            raise RuntimeError(f"Network error fetching {label}: {e}")
+            error_cls = TransientError if is_transient_error(e) else RuntimeError
+            raise error_cls(f"Network error fetching {label}: {e}") from e
         except Exception as e:
             raise RuntimeError(f"Unexpected error fetching {label}: {e}")
         if resp.status_code != 200:
-            raise RuntimeError(f"HTTP {resp.status_code} fetching {url}")
+            error_cls = TransientError if resp.status_code in TRANSIENT_STATUS_CODES else RuntimeError
+            raise error_cls(f"HTTP {resp.status_code} fetching {url}")
         ctype = (resp.headers.get("Content-Type") or "").lower()
         if "html" not in ctype:
             logging.warning("Expected HTML but got Content-Type=%s for %s", ctype, url)
-        return resp.text
+        # Raw bytes: the parser detects the charset itself, skipping a separate decode pass
+        return resp.content
+
+    def _map_pages(self, parse_page: Callable[[str], Optional[Dict[str, Any]]], urls: List[str], desc: str) -> List[Dict[str, Any]]:
+        """Run parse_page over the urls concurrently; keeps input order and drops None results."""
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            parsed = list(tqdm(executor.map(parse_page, urls), total=len(urls), desc=desc))
+        return [p for p in parsed if p]
 
-    def _soup(self, html: str):
+    def _soup(self, html: Union[str, bytes]):
         try:
             from bs4 import BeautifulSoup
         except Exception as e:
             raise RuntimeError(f"Missing dependency 'beautifulsoup4': {e}")
         try:
-            return BeautifulSoup(html, "html.parser")
+            return BeautifulSoup(html, HTML_PARSER)
         except Exception as e:
             raise RuntimeError(f"Failed to parse HTML: {e}")
 
     def _split_authors(self, text: str) -> List[str]:
-        parts = re.split(r",|\band\b", text or "", flags=re.IGNORECASE)
-        return [re.sub(r"\s+", " ", p).strip().title() for p in parts if p and p.strip()]
+        parts = self.AUTHOR_SEP_PAT.split(text or "")
+        return [self.WS_PAT.sub(" ", p).strip().title() for p in parts if p and p.strip()]
 
     # Optional override per site
     def _html_to_pdf_link(self, url: str) -> str:
@@ -416,6 +470,13 @@ class NeuripsFetcher(BaseFetcher):
 class PoPETsFetcher(BaseFetcher):
     SITE = "PoPETs"
     BASE = "https://petsymposium.org/popets"
+    # Author-line cleanup patterns
+    PDF_LABEL_PAT = re.compile(r"\bPDF\b", re.I)
+    LEADING_PUNCT_PAT = re.compile(r"^\s*[\]\)\-–—:|]+")
+    BRACKETED_PAT = re.compile(r"\[[^\]]*\]")
+    PARENTHESIZED_PAT = re.compile(r"\([^)]*\)")
+    TRAILING_LINKS_PAT = re.compile(r"\b(Artifact|Artifacts?|Code|Dataset|Video|Slides|Source|Supplementary)\b.*$", re.I)
+    AUTHOR_LIST_SEP_PAT = re.compile(r",|;|\band\b", re.I)
 
     def _toc_url(self, year: int) -> str:
         return f"{self.BASE}/{year}/"
@@ -492,16 +553,16 @@ class PoPETsFetcher(BaseFetcher):
                 if not authors_text:
                     # fallback: everything after 'PDF'
                     raw = li.get_text(" ", strip=True)
-                    authors_text = re.split(r"\bPDF\b", raw, flags=re.I)[-1]
+                    authors_text = self.PDF_LABEL_PAT.split(raw)[-1]
 
                 # cleanup
-                authors_text = re.sub(r"^\s*[\]\)\-–—:|]+", " ", authors_text)           # trim leading ] ) : -
-                authors_text = re.sub(r"\[[^\]]*\]", " ", authors_text)                  # drop bracketed tokens
-                authors_text = re.sub(r"\([^)]*\)", " ", authors_text)                   # drop affiliations
-                authors_text = re.sub(r"\b(Artifact|Artifacts?|Code|Dataset|Video|Slides|Source|Supplementary)\b.*$", " ", authors_text, flags=re.I)
-                authors_text = re.sub(r"\s+", " ", authors_text).strip(" ,;:-")
+                authors_text = self.LEADING_PUNCT_PAT.sub(" ", authors_text)             # trim leading ] ) : -
+                authors_text = self.BRACKETED_PAT.sub(" ", authors_text)                 # drop bracketed tokens
+                authors_text = self.PARENTHESIZED_PAT.sub(" ", authors_text)             # drop affiliations
+                authors_text = self.TRAILING_LINKS_PAT.sub(" ", authors_text)
+                authors_text = self.WS_PAT.sub(" ", authors_text).strip(" ,;:-")
 
-                authors = [re.sub(r"\s+", " ", s).strip(" ,;") for s in re.split(r",|;|\band\b", authors_text, flags=re.I) if s.strip()]
+                authors = [self.WS_PAT.sub(" ", s).strip(" ,;") for s in self.AUTHOR_LIST_SEP_PAT.split(authors_text) if s.strip()]
 
                 results.append({"title": title, "authors": authors, "paper_url": paper_url})
             except Exception as e:
@@ -514,6 +575,8 @@ class PoPETsFetcher(BaseFetcher):
 class UsenixSecurityFetcher(BaseFetcher):
     SITE = "USENIX Security"
     BASE = "https://www.usenix.org"
+    # BibTeX fallback for authors: author = {A and B and C}
+    BIBTEX_AUTHOR_PAT = re.compile(r"author\s*=\s*\{([^}]+)\}", re.IGNORECASE | re.DOTALL)
 
     def _sessions_url(self, year: int) -> str:
         yy = f"{year % 100:02d}"
@@ -533,50 +596,56 @@ class UsenixSecurityFetcher(BaseFetcher):
                 pres_links.append(urljoin(sessions_url, href))
         pres_links = sorted(set(pres_links))
 
-        # 2) parse each presentation page for title, authors, pdf
-        results: List[Dict[str, Any]] = []
-        for url in tqdm(pres_links, f"Fetching USENIX {year} papers"):
-            try:
-                phtml = self._fetch_html(url, headers, "presentation page")
-                psoup = self._soup(phtml)
+        # 2) parse each presentation page for title, authors, pdf (pages fetched concurrently)
+        return self._map_pages(lambda url: self._parse_presentation(url, headers), pres_links, f"Fetching USENIX {year} papers")
 
-                # title
-                h1 = psoup.find("h1")
-                title = (h1.get_text(strip=True) if h1 else "").strip()
-                if not title:
-                    continue
-
-                # authors (prefer meta tags; fallback to BibTeX)
-                authors = [m.get("content").strip() for m in psoup.select('meta[name="citation_author"]') if m.get("content")]
-                if not authors:
-                    # try BibTeX: author = {A and B and C}
-                    m = re.search(r"author\s*=\s*\{([^}]+)\}", psoup.get_text("\n", strip=True), flags=re.IGNORECASE | re.DOTALL)
-                    if m:
-                        authors = [a.strip() for a in m.group(1).split(" and ") if a.strip()]
-
-                # pdf url (skip slides if both exist)
-                pdf_url = ""
-                for a in psoup.select('a[href$=".pdf"], a[href*=".pdf?"]'):
-                    href = a.get("href") or ""
-                    if href:
-                        cand = urljoin(url, href)
-                        name = cand.lower()
-                        if "slides" in name or "talk" in name:
-                            continue
-                        pdf_url = cand
-                        break
-                if not pdf_url:
-                    continue
-
-                results.append({"title": title, "authors": authors, "paper_url": pdf_url})
-            except Exception as e:
-                logging.warning("Skipping one presentation (%s): %s", url, e)
+    def _parse_presentation(self, url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        try:
+            phtml = self._fetch_html(url, headers, "presentation page")
+            psoup = self._soup(phtml)
+
+            # title
+            h1 = psoup.find("h1")
+            title = (h1.get_text(strip=True) if h1 else "").strip()
+            if not title:
+                return None
+
+            # authors (prefer meta tags; fallback to BibTeX)
+            authors = [m.get("content").strip() for m in psoup.select('meta[name="citation_author"]') if m.get("content")]
+            if not authors:
+                # try BibTeX: author = {A and B and C}
+                m = self.BIBTEX_AUTHOR_PAT.search(psoup.get_text("\n", strip=True))
+                if m:
+                    authors = [a.strip() for a in m.group(1).split(" and ") if a.strip()]
+
+            # pdf url (skip slides if both exist)
+            pdf_url = ""
+            for a in psoup.select('a[href$=".pdf"], a[href*=".pdf?"]'):
+                href = a.get("href") or ""
+                if href:
+                    cand = urljoin(url, href)
+                    name = cand.lower()
+                    if "slides" in name or "talk" in name:
+                        continue
+                    pdf_url = cand
+                    break
+            if not pdf_url:
+                return None
 
-        return results
+            return {"title": title, "authors": authors, "paper_url": pdf_url}
+        except Exception as e:
+            logging.warning("Skipping one presentation (%s): %s", url, e)
+            return None
     
 class UsenixSoupsFetcher(BaseFetcher):
     SITE = "USENIX SOUPS"
     BASE = "https://www.usenix.org"
+    # Byline parsing patterns
+    BYLINE_END_PAT = re.compile(r"(Abstract|Open Access Media|Resources|Session)", re.I)
+    BYLINE_NOISE_PAT = re.compile(r"\[[^\]]*\]|\([^)]*\)")
+    BYLINE_AND_PAT = re.compile(r"\s+and\s+", re.I)
+    BYLINE_SEP_PAT = re.compile(r";|\n|•|\u2022")
+    NAME_WORD_PAT = re.compile(r"[A-Z][\w'’\-]+")
 
     def _sessions_url(self, year: int) -> str:
         return f"{self.BASE}/conference/soups{year}/technical-sessions"
@@ -610,19 +679,19 @@ class UsenixSoupsFetcher(BaseFetcher):
                 if el == h1: continue
                 txt = (el.get_text(" ", strip=True) if getattr(el, "get_text", None) else str(el)).strip()
                 if not txt: continue
-                if re.match(r"(Abstract|Open Access Media|Resources|Session)", txt, re.I):
+                if self.BYLINE_END_PAT.match(txt):
                     break
                 byline = txt
                 break
             if byline:
                 # normalize and split into people; keep text before first comma (drop affiliations)
-                byline = re.sub(r"\[[^\]]*\]|\([^)]*\)", " ", byline)
-                byline = re.sub(r"\s+and\s+", ";", byline, flags=re.I)
-                parts = [p.strip(" ;,") for p in re.split(r";|\n|•|\u2022", byline) if p.strip()]
+                byline = self.BYLINE_NOISE_PAT.sub(" ", byline)
+                byline = self.BYLINE_AND_PAT.sub(";", byline)
+                parts = [p.strip(" ;,") for p in self.BYLINE_SEP_PAT.split(byline) if p.strip()]
                 names = []
                 for p in parts:
                     name = p.split(",")[0].strip()
-                    if len([w for w in name.split() if re.match(r"[A-Z][\w'’\-]+", w)]) >= 2:
+                    if len([w for w in name.split() if self.NAME_WORD_PAT.match(w)]) >= 2:
                         names.append(name)
                 if names:
                     return self._uniq(names)
@@ -651,20 +720,21 @@ class UsenixSoupsFetcher(BaseFetcher):
             if a.get("href")
         })
 
-        results: List[Dict[str, Any]] = []
-        for url in tqdm(links, f"Fetching {self.SITE} {year} papers"):
-            try:
-                psoup = self._soup(self._fetch_html(url, headers, "presentation page"))
-                h1 = psoup.find("h1")
-                title = (h1.get_text(strip=True) if h1 else "").strip()
-                if not title:
-                    continue
-                authors = self._authors(psoup)
-                pdf = self._pdf(psoup, url) or url
-                results.append({"title": title, "authors": authors, "paper_url": pdf})
-            except Exception:
-                continue
-        return results
+        # Presentation pages are fetched concurrently
+        return self._map_pages(lambda url: self._parse_presentation(url, headers), links, f"Fetching {self.SITE} {year} papers")
+
+    def _parse_presentation(self, url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        try:
+            psoup = self._soup(self._fetch_html(url, headers, "presentation page"))
+            h1 = psoup.find("h1")
+            title = (h1.get_text(strip=True) if h1 else "").strip()
+            if not title:
+                return None
+            authors = self._authors(psoup)
+            pdf = self._pdf(psoup, url) or url
+            return {"title": title, "authors": authors, "paper_url": pdf}
+        except Exception:
+            return None
 
 
 class ACLLongFetcher(BaseFetcher):
@@ -678,6 +748,8 @@ class ACLLongFetcher(BaseFetcher):
 
         results: List[Dict[str, Any]] = []
         seen_titles = set()
+        pdf_re = re.compile(rf"/{year}\.acl-long\.\d+\.pdf$")
+        page_re = re.compile(rf"/{year}\.acl-long\.\d+/?$")
 
         # Each paper block on the volume page starts with an "pdf" link,
         # then (optionally) "bib"/"abs", then the title link, then author links.
@@ -685,7 +757,7 @@ class ACLLongFetcher(BaseFetcher):
             try:
                 pdf_href = urljoin(self.BASE + "/", pdf_tag.get("href", ""))
                 # only keep real papers like /{year}.acl-long.N.pdf (skip the proceedings front matter)
-                if not re.search(rf"/{year}\.acl-long\.\d+\.pdf$", pdf_href):
+                if not pdf_re.search(pdf_href):
                     continue
 
                 # find the title anchor for this paper
@@ -698,13 +770,13 @@ class ACLLongFetcher(BaseFetcher):
                     txt = (t.get_text(" ", strip=True) or "").strip()
                     if txt.lower() in {"pdf", "bib", "abs"}:
                         continue
-                    if re.search(rf"/{year}\.acl-long\.\d+/?$", t.get("href", "")):
+                    if page_re.search(t.get("href", "")):
                         title_a = t
                         break
                 if not title_a:
                     continue
 
-                title = re.sub(r"\s+", " ", title_a.get_text(strip=True))
+                title = self.WS_PAT.sub(" ", title_a.get_text(strip=True))
                 if not title or title in seen_titles:
                     continue
                 seen_titles.add(title)
@@ -723,7 +795,7 @@ class ACLLongFetcher(BaseFetcher):
                         name = (p.get_text(" ", strip=True) or "").strip()
                         href = p.get("href", "") or ""
                         if name and ("/people/" in href or "/author/" in href or "/authors/" in href):
-                            authors.append(re.sub(r"\s+", " ", name))
+                            authors.append(self.WS_PAT.sub(" ", name))
 
                 results.append({
                     "title": title,
@@ -747,6 +819,7 @@ class ACLFindingsFetcher(BaseFetcher):
         results: List[Dict[str, Any]] = []
         seen_titles = set()
         pdf_re = re.compile(rf"/{year}\.findings-acl\.(\d+)\.pdf$")  # capture ID
+        page_re = re.compile(rf"/{year}\.findings-acl\.\d+/?$")
 
         for pdf_tag in tqdm(soup.find_all("a", string=lambda t: t and t.strip().lower() == "pdf"), f"Fetching {self.SITE} {year} papers"):
             try:
@@ -767,13 +840,13 @@ class ACLFindingsFetcher(BaseFetcher):
                     txt = (t.get_text(" ", strip=True) or "")
                     if txt.lower() in {"pdf", "bib", "abs"}:
                         continue
-                    if re.search(rf"/{year}\.findings-acl\.\d+/?$", t.get("href", "")):
+                    if page_re.search(t.get("href", "")):
                         title_a = t
                         break
                 if not title_a:
                     continue
 
-                title = re.sub(r"\s+", " ", title_a.get_text(strip=True))
+                title = self.WS_PAT.sub(" ", title_a.get_text(strip=True))
                 if not title or title in seen_titles:
                     continue
                 seen_titles.add(title)
@@ -791,7 +864,7 @@ class ACLFindingsFetcher(BaseFetcher):
                             break
                         href = p.get("href", "")
                         if any(seg in href for seg in ("/people/", "/author/", "/authors/")):
-                            name = re.sub(r"\s+", " ", p.get_text(" ", strip=True)).strip()
+                            name = self.WS_PAT.sub(" ", p.get_text(" ", strip=True)).strip()
                             if name:
                                 authors.append(name)
 
@@ -1,7 +1,7 @@
 KEYWORDS_GENERATION_PROMPT = """
 <instructions>
 You generate a concise topic definition and a compact, title-friendly keyword list for academic retrieval.
-Return ONLY valid JSON: {"topic":"...","definition":"...","keywords":[...]}.
+Return ONLY valid JSON (no prose, no code fences): {{"topic":"...","definition":"...","keywords":[...]}}.
 Rules:
 - Definition: 1–2 sentences for TITLE filtering; state scope and key exclusions.
 - Keywords: 12–16 unique items; no slashes; 1–3 words (allow standard multiword phrases); deduplicated.
@@ -15,11 +15,11 @@ Topic="topic to analyze"
 </input>
 
 <output_format>
-{
+{{
   "topic": "<echo the input>",
   "definition": "concise scope for title filtering with key inclusions/exclusions.",
   "keywords": ["...", "...", "..."]
-}
+}}
 </output_format>
 
 Now produce the output for this Topic: {topic}